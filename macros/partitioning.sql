@@ -0,0 +1,131 @@
+{#
+    Range partitioning for Postgres models.
+
+    Configure a table or incremental model with
+
+        partition_by={'field': 'auction_date', 'granularity': 'month', 'lookahead': 3}
+
+    and the built table is created as a range-partitioned parent with one
+    partition per month (or day/week/year) between the earliest value of
+    `field` and `lookahead` periods past the latest one, plus a default
+    partition. Queries filtering on `field` (marts, Superset date ranges) then
+    only scan the matching partitions.
+
+    Add `post_hook=after_commit("{{ sync_range_partitions() }}")` so that
+    partitions created under dbt's intermediate table name get the model's
+    name and new periods are added as incremental runs move the data forward.
+
+    Indexes use the adapter's `indexes` config; on a partitioned table they
+    are created on the parent and inherited by every partition.
+#}
+
+{% macro postgres__create_table_as(temporary, relation, sql) -%}
+  {%- set partition_by = config.get('partition_by') -%}
+  {%- if partition_by and not temporary -%}
+    {{ create_range_partitioned_table_as(relation, sql, partition_by) }}
+  {%- else -%}
+    {{ dbt.postgres__create_table_as(temporary, relation, sql) }}
+  {%- endif -%}
+{%- endmacro %}
+
+
+{% macro create_range_partitioned_table_as(relation, sql, partition_by) -%}
+  {%- set source = relation.identifier ~ '__partition_src' -%}
+
+  create temporary table {{ adapter.quote(source) }} as (
+    {{ sql }}
+  );
+
+  create table {{ relation }} (like {{ adapter.quote(source) }} including defaults)
+  partition by range ({{ partition_by.field }});
+
+  create table {{ relation.include(identifier=false) }}.{{ adapter.quote(relation.identifier ~ '_default') }}
+  partition of {{ relation }} default;
+
+  {{ create_range_partitions_sql(relation, partition_by, adapter.quote(source)) }};
+
+  insert into {{ relation }} select * from {{ adapter.quote(source) }};
+
+  drop table {{ adapter.quote(source) }}
+{%- endmacro %}
+
+
+{#
+    Create the partitions of `relation` covering the values of the partition
+    field found in `source` plus the configured lookahead. Periods that
+    already have a partition, or rows sitting in the default partition, are
+    skipped.
+#}
+{% macro create_range_partitions_sql(relation, partition_by, source) -%}
+  {%- set field = partition_by.field -%}
+  {%- set granularity = partition_by.get('granularity', 'month') -%}
+  {%- set lookahead = partition_by.get('lookahead', 3) -%}
+  {%- set suffix_format = {'day': 'YYYYMMDD', 'week': 'IYYYIW', 'month': 'YYYYMM', 'year': 'YYYY'}[granularity] -%}
+  {%- set default_partition = relation.include(identifier=false) ~ '.' ~ adapter.quote(relation.identifier ~ '_default') -%}
+
+  do $$
+  declare
+      period_start date;
+      last_period date;
+      partition_name text;
+  begin
+      select date_trunc('{{ granularity }}', min({{ field }}))::date,
+             (date_trunc('{{ granularity }}', max({{ field }})) + interval '{{ lookahead }} {{ granularity }}')::date
+        into period_start, last_period
+        from {{ source }};
+
+      while period_start <= last_period loop
+          partition_name := '{{ relation.identifier }}_p' || to_char(period_start, '{{ suffix_format }}');
+
+          if to_regclass(format('%I.%I', '{{ relation.schema }}', partition_name)) is null
+             and not exists (
+                 select 1 from {{ default_partition }}
+                 where {{ field }} >= period_start
+                   and {{ field }} < period_start + interval '1 {{ granularity }}'
+             ) then
+              execute format(
+                  'create table %I.%I partition of {{ relation }} for values from (%L) to (%L)',
+                  '{{ relation.schema }}', partition_name,
+                  period_start, (period_start + interval '1 {{ granularity }}')::date
+              );
+          end if;
+
+          period_start := (period_start + interval '1 {{ granularity }}')::date;
+      end loop;
+  end $$
+{%- endmacro %}
+
+
+{% macro sync_range_partitions(relation=this) -%}
+  {{ return(adapter.dispatch('sync_range_partitions')(relation)) }}
+{%- endmacro %}
+
+{% macro default__sync_range_partitions(relation) -%}
+{%- endmacro %}
+
+{% macro postgres__sync_range_partitions(relation) -%}
+  {%- set partition_by = config.get('partition_by') -%}
+  {%- if partition_by -%}
+
+  -- Partitions built under dbt's intermediate table name take the model's name
+  do $$
+  declare
+      part record;
+  begin
+      for part in
+          select c.relname,
+                 '{{ relation.identifier }}' || substring(c.relname from '(_p[0-9]+|_default)$') as target_name
+            from pg_inherits i
+            join pg_class c on c.oid = i.inhrelid
+           where i.inhparent = '{{ relation }}'::regclass
+      loop
+          if part.relname <> part.target_name then
+              execute format('alter table %I.%I rename to %I', '{{ relation.schema }}', part.relname, part.target_name);
+          end if;
+      end loop;
+  end $$;
+
+  {{ create_range_partitions_sql(relation, partition_by, relation) }}
+
+  {%- endif -%}
+{%- endmacro %}
@@ -0,0 +1,11 @@
+{{ config(materialized='view') }}
+
+-- One row per customer who has placed bids
+
+select
+    customer_id,
+    total_bids,
+    winning_bids,
+    winning_bid_amount as total_spent
+from {{ ref('int_bid_stats') }}
+where grain = 'customer'
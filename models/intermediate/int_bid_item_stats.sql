@@ -0,0 +1,11 @@
+{{ config(materialized='view') }}
+
+-- One row per item with bids
+
+select
+    item_id,
+    total_bids,
+    max_bid_amount,
+    winning_bid_amount
+from {{ ref('int_bid_stats') }}
+where grain = 'item'
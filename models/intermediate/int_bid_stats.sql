@@ -0,0 +1,54 @@
+{{ config(
+    materialized='incremental',
+    unique_key=['grain', 'grain_id'],
+    incremental_strategy='delete+insert',
+    indexes=[
+        {'columns': ['grain', 'grain_id']},
+        {'columns': ['grain', 'item_id']},
+        {'columns': ['grain', 'customer_id']},
+    ]
+) }}
+
+-- Bid aggregates at item and customer grain, computed in a single pass over
+-- stg_bids with grouping sets. The bid-based marts read these through
+-- int_bid_item_stats and int_bid_customer_stats instead of each scanning bids.
+-- Incremental runs re-aggregate only the items and customers with bids from the
+-- last `incremental_lookback_days` days before the latest bid already counted,
+-- over all of their bids, and replace their rows (keyed on grain_id, the row's
+-- item_id or customer_id, since the other id is null).
+
+{% if is_incremental() %}
+with recent_bids as (
+    select item_id, customer_id
+    from {{ ref('stg_bids') }}
+    -- On auction_date, so only the recent partitions of stg_bids are scanned
+    -- (bids are placed on their auction date)
+    where auction_date >= (
+        select cast({{ dbt.dateadd('day', -var('incremental_lookback_days'), 'max(last_bid_at)') }} as date)
+        from {{ this }}
+    )
+)
+{% endif %}
+
+select
+    case when grouping(item_id) = 0 then 'item' else 'customer' end as grain,
+    coalesce(item_id, customer_id) as grain_id,
+    item_id,
+    customer_id,
+    count(bid_id) as total_bids,
+    max(bid_amount) as max_bid_amount,
+    sum(case when is_winning_bid then 1 else 0 end) as winning_bids,
+    sum(case when is_winning_bid then bid_amount else 0 end) as winning_bid_amount,
+    max(bid_timestamp) as last_bid_at
+from {{ ref('stg_bids') }}
+{% if is_incremental() %}
+-- All bids of the affected items and customers; the having clause drops the
+-- partial rows this gives other items and customers
+where item_id in (select item_id from recent_bids)
+   or customer_id in (select customer_id from recent_bids)
+{% endif %}
+group by grouping sets ((item_id), (customer_id))
+{% if is_incremental() %}
+having (grouping(item_id) = 0 and item_id in (select item_id from recent_bids))
+    or (grouping(item_id) = 1 and customer_id in (select customer_id from recent_bids))
+{% endif %}
@@ -0,0 +1,44 @@
+{{ config(
+    materialized='incremental',
+    unique_key='item_id',
+    incremental_strategy='delete+insert',
+    indexes=[{'columns': ['item_id']}]
+) }}
+
+-- Fees pivoted to one row per item, for itemsbasics. An item's fees are written
+-- with the item and never change afterwards, so incremental runs only read rows
+-- for items above the highest item_id already summarized.
+-- With the fee_summary_source var the fee_summary file written by
+-- generate_auction_data.py --fee-summary is read as is instead of aggregating
+-- fees; run with --full-refresh after switching.
+
+{% set summary_source = var('fee_summary_source', false) %}
+
+with new_rows as (
+    select *
+    from {{ source('raw_data', 'fee_summary') if summary_source else source('raw_data', 'fees') }}
+    {% if is_incremental() %}
+    where item_id > (select coalesce(max(item_id), 0) from {{ this }})
+    {% endif %}
+)
+
+{% if summary_source %}
+select
+    cast(item_id as integer) as item_id,
+    cast(seller_service_fee as integer) as seller_service_fee,
+    cast(lot_fee as integer) as lot_fee,
+    cast(power_washing as integer) as power_washing,
+    cast(decal_removal as integer) as decal_removal,
+    cast(total_fees as integer) as total_fees
+from new_rows
+{% else %}
+select
+    cast(item_id as integer) as item_id,
+    cast(sum(case when fee_type = 'Seller Service Fee' then fee_amount else 0 end) as integer) as seller_service_fee,
+    cast(sum(case when fee_type = 'Lot Fee' then fee_amount else 0 end) as integer) as lot_fee,
+    cast(sum(case when fee_type = 'Power Washing' then fee_amount else 0 end) as integer) as power_washing,
+    cast(sum(case when fee_type = 'Decal Removal' then fee_amount else 0 end) as integer) as decal_removal,
+    cast(sum(fee_amount) as integer) as total_fees
+from new_rows
+group by item_id
+{% endif %}
@@ -8,17 +8,12 @@ with items as (
     select * from {{ ref('stg_items') }}
 ),
 
-bids as (
-    select * from {{ ref('stg_bids') }}
-),
-
--- Find the winning bid (highest bid) for each item
+-- Winning bid (highest bid) for each item, from the shared bid aggregate
 winning_bids as (
     select
         item_id,
-        max(bid_amount) as winning_bid_amount
-    from bids
-    group by item_id
+        max_bid_amount as winning_bid_amount
+    from {{ ref('int_bid_item_stats') }}
 ),
 
 -- Join items with their winning bids and aggregate by category
@@ -43,4 +38,4 @@ select
     min_bid,
     max_bid
 from category_totals
-order by total_winning_bid_amount desc
\ No newline at end of file
+order by total_winning_bid_amount desc
@@ -0,0 +1,44 @@
+{{ config(
+    materialized='incremental',
+    unique_key='auction_date',
+    incremental_strategy='delete+insert',
+    indexes=[{'columns': ['auction_date']}, {'columns': ['category', 'auction_date']}]
+) }}
+
+-- Daily Auction Rollup
+-- One row per auction_date x category x location_state x business_segment so
+-- dashboards (weekly lot value, category mix, state volume) read a few thousand
+-- rows instead of scanning every item. Incremental runs rebuild whole auction days
+-- within `incremental_lookback_days` of the latest day already built.
+
+with items as (
+    select * from {{ ref('stg_items') }}
+    {% if is_incremental() %}
+    where auction_date >= (
+        select {{ dbt.dateadd('day', -var('incremental_lookback_days'), 'max(auction_date)') }}
+        from {{ this }}
+    )
+    {% endif %}
+)
+
+select
+    auction_date,
+    cast(date_trunc('week', auction_date) as date) as week_start,
+    category,
+    location_state,
+    business_segment,
+    count(*) as total_lots,
+    count(*) filter (where reserve_met) as reserve_met_lots,
+    sum(num_bids) as total_bids,
+    sum(hammer) as total_hammer,
+    sum(buyers_premium) as total_buyers_premium,
+    sum(contract_price) as total_contract_price,
+    min(hammer) as min_hammer,
+    max(hammer) as max_hammer,
+    -- Value distribution: lot counts per hammer band
+    count(*) filter (where hammer < 5000) as lots_under_5k,
+    count(*) filter (where hammer >= 5000 and hammer < 15000) as lots_5k_to_15k,
+    count(*) filter (where hammer >= 15000 and hammer < 30000) as lots_15k_to_30k,
+    count(*) filter (where hammer >= 30000) as lots_30k_plus
+from items
+group by 1, 2, 3, 4, 5
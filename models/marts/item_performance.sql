@@ -1,4 +1,23 @@
-{{ config(materialized='table') }}
+{{ config(
+    materialized='incremental',
+    unique_key='item_id',
+    incremental_strategy='delete+insert',
+    indexes=[{'columns': ['item_id']}, {'columns': ['auction_date']}]
+) }}
+
+-- Incremental runs only re-aggregate items auctioned within `incremental_lookback_days`
+-- of the latest auction date already built. Each item is always aggregated over
+-- all of its bids, so `dbt run --full-refresh` produces identical rows.
+
+with items as (
+    select * from {{ ref('stg_items') }}
+    {% if is_incremental() %}
+    where auction_date >= (
+        select {{ dbt.dateadd('day', -var('incremental_lookback_days'), 'max(auction_date)') }}
+        from {{ this }}
+    )
+    {% endif %}
+)
 
 select
     i.item_id,
@@ -6,11 +25,10 @@ select
     i.category,
     i.starting_bid,
     i.auction_date,
-    count(b.bid_id) as total_bids,
-    max(b.bid_amount) as final_price,
-    max(b.bid_amount) - i.starting_bid as price_increase,
-    round((max(b.bid_amount) - i.starting_bid) / i.starting_bid * 100, 2) as price_increase_pct
-from {{ ref('stg_items') }} i
-left join {{ ref('stg_bids') }} b
+    coalesce(b.total_bids, 0) as total_bids,
+    b.max_bid_amount as final_price,
+    b.max_bid_amount - i.starting_bid as price_increase,
+    round(cast(b.max_bid_amount - i.starting_bid as numeric) / i.starting_bid * 100, 2) as price_increase_pct
+from items i
+left join {{ ref('int_bid_item_stats') }} b
     on i.item_id = b.item_id
-group by i.item_id, i.item_name, i.category, i.starting_bid, i.auction_date
\ No newline at end of file
@@ -1,21 +1,15 @@
-{{ config(materialized='table')}}
+{{ config(
+    materialized='table',
+    partition_by={'field': 'auctiondate', 'granularity': 'month'},
+    indexes=[{'columns': ['unique_id']}],
+    post_hook=after_commit("{{ sync_range_partitions() }}")
+) }}
 
-with fee_pivot as (
-    select
-        item_id,
-        sum(case when fee_type= 'Seller Service Fee' then fee_amount else 0 end) as seller_service_fee,
-        sum(case when fee_type= 'Lot Fee' then fee_amount else 0 end) as lot_fee,
-        sum(case when fee_type='Power Washing' then fee_amount else 0 end) as power_washing,
-        sum(case when fee_type='Decal Removal' then fee_amount else 0 end) as decal_removal,
-        sum(fee_amount) as total_fees
-    from {{source('raw_data', 'fees')}}
-    group by item_id
-
-)
+-- Fees come pre-pivoted per item from the incremental int_fee_summary model
 
 select
-    i.unique_id,
-    i.auctiondate,
+    i.item_id as unique_id,
+    i.auction_date as auctiondate,
     i.icn,
     i.model,
     i.category,
@@ -26,5 +20,5 @@ select
     coalesce(f.power_washing, 0) as power_washing,
     coalesce(f.decal_removal, 0) as decal_removal,
     coalesce(f.total_fees, 0) as total_fees
-from {{ source('raw_data', 'items_v2')}} i
-left join fee_pivot f on i.unique_id = f.item_id
\ No newline at end of file
+from {{ ref('stg_items') }} i
+left join {{ ref('int_fee_summary') }} f on i.item_id = f.item_id
\ No newline at end of file
@@ -0,0 +1,43 @@
+{{ config(
+    materialized='incremental',
+    unique_key='week_start',
+    incremental_strategy='delete+insert',
+    indexes=[{'columns': ['week_start']}]
+) }}
+
+-- Weekly Auction Rollup
+-- daily_auction_rollup summed to ISO weeks (week-10 dip, week-15 slowdown
+-- charts). Incremental runs rebuild every week touched by the daily lookback.
+
+with daily as (
+    select * from {{ ref('daily_auction_rollup') }}
+    {% if is_incremental() %}
+    where week_start >= (
+        select cast(date_trunc('week', {{ dbt.dateadd('day', -var('incremental_lookback_days'), 'max(week_start)') }}) as date)
+        from {{ this }}
+    )
+    {% endif %}
+)
+
+select
+    week_start,
+    cast(extract(isoyear from week_start) as integer) as iso_year,
+    cast(extract(week from week_start) as integer) as iso_week,
+    category,
+    location_state,
+    business_segment,
+    count(distinct auction_date) as auction_days,
+    sum(total_lots) as total_lots,
+    sum(reserve_met_lots) as reserve_met_lots,
+    sum(total_bids) as total_bids,
+    sum(total_hammer) as total_hammer,
+    sum(total_buyers_premium) as total_buyers_premium,
+    sum(total_contract_price) as total_contract_price,
+    min(min_hammer) as min_hammer,
+    max(max_hammer) as max_hammer,
+    sum(lots_under_5k) as lots_under_5k,
+    sum(lots_5k_to_15k) as lots_5k_to_15k,
+    sum(lots_15k_to_30k) as lots_15k_to_30k,
+    sum(lots_30k_plus) as lots_30k_plus
+from daily
+group by week_start, category, location_state, business_segment
@@ -1,10 +1,32 @@
-{{ config(materialized='view') }}
+{{ config(
+    materialized='incremental',
+    unique_key='bid_id',
+    incremental_strategy='delete+insert',
+    partition_by={'field': 'auction_date', 'granularity': 'month'},
+    indexes=[
+        {'columns': ['bid_id']},
+        {'columns': ['item_id']},
+        {'columns': ['customer_id']},
+    ],
+    post_hook=after_commit("{{ sync_range_partitions() }}")
+) }}
+
+-- Materialized so marts read bids from one table instead of re-reading the source.
+-- Incremental runs re-stage only bids from the last `incremental_lookback_days`
+-- days before the latest bid already staged.
 
 select
     bid_id,
     item_id,
-    customer_id,
+    bidder_id as customer_id,
     bid_amount,
-    bid_timestamp::timestamp as bid_timestamp,
-    is_winning_bid::boolean as is_winning_bid
-from {{ source('raw_data', 'bids') }}
\ No newline at end of file
+    cast(bid_timestamp as timestamp) as bid_timestamp,
+    cast(bid_timestamp as date) as auction_date,  -- bids are placed on the auction day
+    cast(is_winning_bid as boolean) as is_winning_bid
+from {{ source('raw_data', 'bids') }}
+{% if is_incremental() %}
+where cast(bid_timestamp as timestamp) >= (
+    select {{ dbt.dateadd('day', -var('incremental_lookback_days'), 'max(bid_timestamp)') }}
+    from {{ this }}
+)
+{% endif %}
@@ -6,6 +6,8 @@ select
     last_name,
     lower(email) as email,  -- Standardize email to lowercase
     upper(state) as state,  -- Standardize state to uppercase
-    signup_date::date as signup_date
+    customer_type,
+    business_segment,
+    cast(active as boolean) as active
 from {{ source('raw_data', 'customers') }}
 --Testing GitHub Actions CI
\ No newline at end of file
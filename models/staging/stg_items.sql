@@ -1,9 +1,32 @@
 {{ config(materialized='view') }}
 
+-- Items from the items_v2 feed written by scripts/generate_auction_data.py.
+-- A view, so the item data is stored once (in items_v2) and every model
+-- downstream shares the same names and types.
+
 select
-    item_id,
-    item_name,
+    unique_id as item_id,
+    icn,
+    cast(auctiondate as date) as auction_date,
+    year,
+    make,
+    model,
+    concat_ws(' ', year, make, model) as item_name,
     category,
+    subcategory,
+    location_state,
+    location_city,
     starting_bid,
-    auction_date::date as auction_date
-from {{ source('raw_data', 'item') }}
\ No newline at end of file
+    reserve_price,
+    hammer,
+    buyers_premium,
+    contract_price,
+    cast(reserve_met as boolean) as reserve_met,
+    seller_id,
+    buyer_id,
+    num_bids,
+    region_id,
+    district_id,
+    territory_id,
+    business_segment
+from {{ source('raw_data', 'items_v2') }}
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""
+pytest-benchmark suite for generate_auction_data.py.
+
+Not collected by a plain `pytest` run; point pytest at this file:
+
+    pip install pytest pytest-benchmark
+    pytest scripts/bench_generator.py --benchmark-autosave
+    pytest scripts/bench_generator.py --benchmark-compare --benchmark-compare-fail=mean:10%
+
+The engine benchmarks generate the first two auction weeks only, so the whole
+suite runs in well under a minute.
+"""
+
+import random
+
+import pytest
+
+import generate_auction_data as gad
+
+@pytest.fixture(scope='module')
+def customers():
+    random.seed(42)
+    return gad.generate_customers()
+
+@pytest.fixture
+def two_weeks():
+    """Limit the auction calendar (and the state quotas) to its first six auction days."""
+    gad.configure(end_date=gad.generate_auction_dates(gad.DEFAULT_START_DATE, gad.DEFAULT_END_DATE)[5])
+    yield
+    gad.configure()
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+def test_generate_customers(benchmark):
+    benchmark(gad.generate_customers)
+
+def test_generate_icn(benchmark):
+    benchmark(gad.generate_icn)
+
+def test_pick_seller_for_category(benchmark, customers):
+    sellers = [c for c in customers if c['customer_type'] in ['seller', 'both']]
+    seller_index = gad.SellerIndex(sellers)
+    benchmark(gad.pick_seller_for_category, seller_index, 'Construction')
+
+def test_state_quota_pick(benchmark):
+    def pick_1000(sampler):
+        for _ in range(1000):
+            sampler.pick()
+    
+    # Fresh quotas each round, so every pick comes from the quota tree
+    benchmark.pedantic(pick_1000, setup=lambda: ((gad.StateQuotaSampler(gad.STATE_DISTRIBUTION),), {}),
+                       rounds=50)
+
+def test_write_csv(benchmark, customers, tmp_path, monkeypatch):
+    (tmp_path / 'seeds').mkdir()
+    monkeypatch.chdir(tmp_path)
+    benchmark(gad.write_csv, 'customers.csv', customers, gad.CUSTOMER_FIELDS)
+
+# ============================================================================
+# ENGINES
+# ============================================================================
+
+def test_python_engine(benchmark, customers, two_weeks):
+    benchmark.pedantic(gad.generate_items_bids_fees, args=(customers,), rounds=3)
+
+@pytest.mark.skipif(gad.np is None, reason="numpy engine requires numpy")
+def test_numpy_engine(benchmark, customers, two_weeks):
+    benchmark.pedantic(gad.generate_items_bids_fees_numpy, args=(customers,), rounds=3)
+
+@pytest.mark.skipif(gad.np is None, reason="numpy engine requires numpy")
+@pytest.mark.parametrize('workers', [1, 2, 4])
+def test_numpy_engine_workers(benchmark, customers, two_weeks, tmp_path, workers):
+    """Generate and write CSV end to end; only a multi-core box shows the --workers speedup."""
+    def generate_and_write():
+        totals = gad.GenerationTotals()
+        with gad.DayWriter(str(tmp_path), workers=workers) as writer:
+            for items, bids, fees in gad.iter_items_bids_fees_numpy(customers, totals, workers=workers):
+                writer.write_day(items, bids, fees)
+    
+    benchmark.pedantic(generate_and_write, rounds=3)
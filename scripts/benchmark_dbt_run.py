@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Benchmark `dbt run` against synthetic datasets of increasing size.
+
+For each scale (1x, 10x, 100x the generator's normal volume by default):
+1. generate the auction data with generate_auction_data.py, scaled up
+2. COPY it into the raw_data tables (load_raw_data.py)
+3. `dbt run --full-refresh`, then a second `dbt run` (incremental path); with
+   --append-days N the next N auction days are loaded in between, so the
+   incremental run processes a realistic daily delta
+4. record per-model wall time from target/run_results.json
+
+Results for every scale go into one CSV and one JSON report, so a model or
+index change can be compared run against run:
+
+    python scripts/benchmark_dbt_run.py --scales 1 10 --output-dir benchmarks
+
+The raw tables are truncated and reloaded for every scale, so point this at a
+local database (profiles.yml `local` target by default), never a shared one.
+The data is loaded into, and dbt runs against, the same --target.
+Each scale multiplies --volume (items per auction day, and the per-state
+quotas with it); --start-date/--end-date and the customer pool options apply
+to every scale, as in generate_auction_data.py.
+"""
+
+import argparse
+import csv
+import json
+import os
+import subprocess
+import time
+from datetime import datetime
+
+import db
+import generate_auction_data as gad
+import load_raw_data
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+REPORT_FIELDS = [
+    'scale', 'phase', 'model', 'status', 'execution_time', 'rows_affected',
+    'items', 'bids', 'fees', 'load_seconds', 'appended_items',
+]
+
+# ============================================================================
+# DATASET
+# ============================================================================
+
+def load_dataset(args, scale, append_days=None):
+    """
+    Generate and COPY one scaled dataset, or with append_days only the next
+    auction days after the loaded one. Returns (row counts, seconds).
+    """
+    conn = db.connect(args)
+    cur = conn.cursor()
+    start = time.time()
+
+    try:
+        load_raw_data.create_tables(cur, args.schema)
+        gad.configure(args.start_date, args.end_date, args.volume * scale,
+                      args.buyers, args.sellers, args.both)
+        watermarks = None
+        if append_days:
+            watermarks = load_raw_data.read_watermarks(cur, args.schema)
+            gad.configure_append(watermarks, append_days)
+        else:
+            cur.execute(f"TRUNCATE {', '.join(f'{args.schema}.{t}' for t in load_raw_data.RAW_TABLES)}")
+        counts = load_raw_data.load_generated(cur, args.schema, args, watermarks)
+        for table in load_raw_data.RAW_TABLES:
+            cur.execute(f'ANALYZE {args.schema}.{table}')
+        conn.commit()
+    finally:
+        cur.close()
+        conn.close()
+
+    return counts, time.time() - start
+
+# ============================================================================
+# DBT
+# ============================================================================
+
+def run_dbt(args, *dbt_args):
+    """Run a dbt command in the project and return the parsed run_results.json."""
+    command = ['dbt', *dbt_args, '--target', args.target, '--profiles-dir', args.profiles_dir]
+    print(f"   $ {' '.join(command)}")
+    subprocess.run(command, cwd=REPO_ROOT, check=True)
+
+    with open(os.path.join(REPO_ROOT, 'target', 'run_results.json')) as f:
+        return json.load(f)
+
+def model_timings(run_results):
+    """(model, status, execution_time, rows_affected) for each model in a run."""
+    return [
+        (
+            result['unique_id'].split('.')[-1],
+            result['status'],
+            round(result['execution_time'], 3),
+            (result.get('adapter_response') or {}).get('rows_affected'),
+        )
+        for result in run_results['results']
+        if result['unique_id'].startswith('model.')
+    ]
+
+# ============================================================================
+# REPORT
+# ============================================================================
+
+def write_report(rows, metadata, output_dir):
+    """Write the benchmark rows as CSV and JSON. Returns both paths."""
+    os.makedirs(output_dir, exist_ok=True)
+    stem = os.path.join(output_dir, f"dbt_run_{metadata['started_at'].replace(':', '')}")
+
+    with open(f'{stem}.csv', 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    with open(f'{stem}.json', 'w') as f:
+        json.dump({'metadata': metadata, 'results': rows}, f, indent=2)
+
+    return f'{stem}.csv', f'{stem}.json'
+
+def git_commit():
+    """Current commit of the project, so reports can be tied to a model version."""
+    result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                            capture_output=True, text=True)
+    return result.stdout.strip() or None
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Time dbt run per model across scaled synthetic datasets.")
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100],
+                        help="Volume multipliers to benchmark (default: 1 10 100)")
+    parser.add_argument('--output-dir', default=os.path.join(REPO_ROOT, 'benchmarks'))
+    parser.add_argument('--skip-incremental', action='store_true',
+                        help="Only time the full-refresh run")
+    parser.add_argument('--append-days', type=int, default=0, metavar='N',
+                        help="Load the next N auction days before the incremental run (default: 0)")
+    parser.add_argument('--engine', choices=['python', 'numpy'], default='numpy' if gad.np else 'python')
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--seller-skew', type=float, default=0.0)
+    db.add_connection_arguments(parser)
+    gad.add_scale_arguments(parser)
+    args = parser.parse_args()
+    db.resolve_connection(parser, args)
+    gad.configure_from_args(parser, args)
+    return args
+
+def main():
+    args = parse_args()
+    metadata = {
+        'started_at': datetime.now().isoformat(timespec='seconds'),
+        'git_commit': git_commit(),
+        'target': args.target,
+        'engine': args.engine,
+        'scales': args.scales,
+        'start_date': f'{args.start_date:%Y-%m-%d}',
+        'end_date': f'{args.end_date:%Y-%m-%d}',
+        'volume': args.volume,
+        'append_days': args.append_days,
+    }
+    rows = []
+
+    print("=" * 80)
+    print("dbt Run Benchmark")
+    print("=" * 80)
+
+    for scale in args.scales:
+        print(f"\n{scale}x: loading data...")
+        counts, load_seconds = load_dataset(args, scale)
+        print(f"   ✓ Loaded {sum(counts.values()):,} rows in {load_seconds:.1f}s")
+
+        phases = [('full_refresh', ('run', '--full-refresh'))]
+        if not args.skip_incremental:
+            phases.append(('incremental', ('run',)))
+
+        appended_items = 0
+        for phase, dbt_args in phases:
+            if phase == 'incremental' and args.append_days:
+                print(f"\n{scale}x: appending {args.append_days} auction days...")
+                appended, _ = load_dataset(args, scale, args.append_days)
+                appended_items = appended['items_v2']
+                print(f"   ✓ Appended {appended_items:,} items")
+
+            print(f"\n{scale}x: dbt {phase}...")
+            run_results = run_dbt(args, *dbt_args)
+            for model, status, execution_time, rows_affected in model_timings(run_results):
+                rows.append({
+                    'scale': scale,
+                    'phase': phase,
+                    'model': model,
+                    'status': status,
+                    'execution_time': execution_time,
+                    'rows_affected': rows_affected,
+                    'items': counts['items_v2'],
+                    'bids': counts['bids'],
+                    'fees': counts['fees'],
+                    'load_seconds': round(load_seconds, 1),
+                    'appended_items': appended_items,
+                })
+            print(f"   ✓ {run_results['elapsed_time']:.1f}s total")
+
+    csv_path, json_path = write_report(rows, metadata, args.output_dir)
+
+    print("\n" + "=" * 80)
+    print(f"{'scale':>6} {'phase':<14} {'model':<30} {'seconds':>9}")
+    for row in rows:
+        print(f"{row['scale']:>5}x {row['phase']:<14} {row['model']:<30} {row['execution_time']:>9.2f}")
+    print(f"\n✓ Report: {csv_path}")
+    print(f"✓ Report: {json_path}")
+    print("=" * 80)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+"""
+Database connections for the scripts, configured the same way as dbt.
+
+Connection settings come from a profiles.yml target, so the loaders talk to
+the same database `dbt run --target X` builds in. Each setting resolves, in
+order:
+1. the command line (--host, --port, --dbname, --user, --password)
+2. the environment (PGHOST, PGPORT, PGDATABASE, PGUSER, PGPASSWORD)
+3. the target in profiles.yml: --target, else DBT_TARGET, else the profile's
+   default target (local); profiles.yml is read from --profiles-dir, else
+   DBT_PROFILES_DIR, else the project root
+
+ConnectionPool opens connections to that database only as concurrent callers
+need them (a single-connection load opens one) and blocks when maxconn are
+checked out, so a burst of queries (run_parallel) or several loader processes
+never open more than maxconn connections each.
+
+Usage from a script:
+    db.add_connection_arguments(parser)
+    args = parser.parse_args()
+    db.resolve_connection(parser, args)
+    conn = db.connect(args)
+"""
+
+import contextlib
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import psycopg2
+import yaml
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Connection setting → libpq environment variable
+ENV_VARS = {
+    'host': 'PGHOST',
+    'port': 'PGPORT',
+    'dbname': 'PGDATABASE',
+    'user': 'PGUSER',
+    'password': 'PGPASSWORD',
+}
+
+DEFAULT_POOL_SIZE = 4
+
+# ============================================================================
+# SETTINGS
+# ============================================================================
+
+def render_env_vars(text):
+    """Substitute {{ env_var('NAME') }} / {{ env_var('NAME', 'default') }} as dbt does."""
+    def substitute(match):
+        name, default = match.group(1), match.group(2)
+        if name not in os.environ and default is None:
+            raise ValueError(f"env var {name} is not set and has no default")
+        return os.environ.get(name, default)
+    return re.sub(r"""\{\{\s*env_var\(\s*['"]([^'"]+)['"]\s*(?:,\s*['"]([^'"]*)['"]\s*)?\)\s*\}\}""", substitute, text)
+
+def load_profile_target(target=None, profiles_dir=None):
+    """Return (target name, output settings) for the project's profile."""
+    with open(os.path.join(REPO_ROOT, 'dbt_project.yml')) as f:
+        profile_name = yaml.safe_load(f)['profile']
+    with open(os.path.join(profiles_dir or REPO_ROOT, 'profiles.yml')) as f:
+        profile = yaml.safe_load(render_env_vars(f.read()))[profile_name]
+
+    target = target or profile['target']
+    if target not in profile['outputs']:
+        raise ValueError(f"profiles.yml has no target {target!r} (targets: {', '.join(profile['outputs'])})")
+    output = profile['outputs'][target]
+    if output['type'] != 'postgres':
+        raise ValueError(f"target {target!r} is {output['type']}; the scripts load into Postgres")
+    return target, output
+
+def add_connection_arguments(parser):
+    """Add the connection options (shared by every script that talks to the database)."""
+    group = parser.add_argument_group('database', "Unset options come from PGHOST, PGPORT, ... and "
+                                                  "then the profiles.yml target")
+    group.add_argument('--target', help="profiles.yml target (default: DBT_TARGET, else the profile default)")
+    group.add_argument('--profiles-dir', help="Directory holding profiles.yml (default: DBT_PROFILES_DIR, "
+                                              "else the project root)")
+    group.add_argument('--host')
+    group.add_argument('--port', type=int)
+    group.add_argument('--dbname')
+    group.add_argument('--user')
+    group.add_argument('--password')
+    group.add_argument('--schema', default='public',
+                       help="Schema of the raw_data source (models/sources.yml)")
+
+def resolve_connection(parser, args):
+    """Fill in args.target, args.profiles_dir and the unset connection options; errors go through the parser."""
+    args.profiles_dir = args.profiles_dir or os.environ.get('DBT_PROFILES_DIR') or REPO_ROOT
+    try:
+        args.target, output = load_profile_target(args.target or os.environ.get('DBT_TARGET'), args.profiles_dir)
+    except (OSError, KeyError, ValueError) as e:
+        parser.error(f"cannot read the connection from profiles.yml: {e}")
+
+    for setting, env_var in ENV_VARS.items():
+        if getattr(args, setting) is None:
+            setattr(args, setting, os.environ.get(env_var) or output.get(setting))
+    if args.port is not None:  # else libpq's default (5432)
+        args.port = int(args.port)
+
+def connection_settings(args):
+    """psycopg2.connect keyword arguments from resolved args."""
+    return {setting: getattr(args, setting) for setting in ENV_VARS}
+
+# ============================================================================
+# CONNECTIONS
+# ============================================================================
+
+def connect(args):
+    """Open a single connection (for one long transaction, e.g. a load)."""
+    return psycopg2.connect(**connection_settings(args))
+
+class ConnectionPool:
+    """
+    A small pool of connections to one database, opened lazily.
+
+    A checkout reuses an idle connection and only opens a new one when all
+    open connections are in use; a semaphore makes callers wait once maxconn
+    are checked out. (psycopg2's ThreadedConnectionPool either opens minconn
+    connections up front or closes returned ones beyond minconn.)
+    """
+
+    def __init__(self, args, maxconn=DEFAULT_POOL_SIZE):
+        self.maxconn = maxconn
+        self._settings = connection_settings(args)
+        self._slots = threading.BoundedSemaphore(maxconn)
+        self._lock = threading.Lock()
+        self._idle = []
+        self._open = []
+
+    @contextlib.contextmanager
+    def connection(self):
+        """Check out a connection; commits on success, rolls back on error."""
+        with self._slots:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                conn = psycopg2.connect(**self._settings)
+                with self._lock:
+                    self._open.append(conn)
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                if not conn.closed:
+                    conn.rollback()
+                raise
+            finally:
+                with self._lock:
+                    if conn.closed:  # lost connection: open a fresh one next time
+                        self._open.remove(conn)
+                    else:
+                        self._idle.append(conn)
+
+    def close(self):
+        with self._lock:
+            for conn in self._open:
+                conn.close()
+            self._open.clear()
+            self._idle.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def run_parallel(pool, queries):
+    """
+    Run {name: sql} (or {name: (sql, params)}) concurrently, one pooled
+    connection per query in flight. Returns {name: rows}.
+    """
+    def run(query):
+        sql, params = query if isinstance(query, tuple) else (query, None)
+        with pool.connection() as conn, conn.cursor() as cur:
+            cur.execute(sql, params)
+            return cur.fetchall()
+
+    with ThreadPoolExecutor(pool.maxconn) as executor:
+        futures = {name: executor.submit(run, query) for name, query in queries.items()}
+        return {name: future.result() for name, future in futures.items()}
@@ -4,7 +4,7 @@ Generate realistic Purple Wave auction data for Bronze layer tables.
 
 Creates 4 CSV files:
 - customers.csv: Buyers and sellers with geographic distribution
-- items_v2.csv: 25,000 auction items (Aug-Dec 2025)
+- items_v2.csv: 25,000 auction items (Aug-Dec 2025 by default)
 - bids.csv: Bid history showing auction activity
 - fees.csv: Fee records for all items
 
@@ -18,12 +18,86 @@ Temporal Distribution:
 - December: ~10,000 items (~833/day, 3 days/week)
 - Week 10 dip: Lower avg lot value ($8k-$8.5k)
 - Week 15 slowdown: Reduced volume (Thanksgiving week)
+
+Engines:
+- python (default): row-at-a-time generation, reproduces the committed seeds
+- numpy: columnar generation of whole auction days for large load-test datasets
+  (same distributions, different random stream; requires numpy)
+
+Usage:
+    python scripts/generate_auction_data.py [--engine {python,numpy}] [--workers N] [--stream]
+
+--workers N (numpy engine) generates auction days across N processes and
+serializes them to CSV/Parquet across another N, streaming like --stream; the
+main process only merges ids and writes the encoded days. Each day has its own
+seed derived from the base seed, so output does not depend on N. On a single
+CPU, --workers runs serially.
+
+--stream writes every auction day to the CSV files as soon as it is generated,
+so memory use stays bounded by one day regardless of the horizon size.
+
+Scale-out (defaults reproduce the committed seeds):
+    --start-date/--end-date  auction calendar; every year keeps the seasonal shape
+                             (week-10 dip and week-15 slowdown counted from August 1,
+                             December surge, Thanksgiving/Christmas excluded)
+    --volume X               multiply items per auction day; per-state quotas follow
+                             the expected item count for the calendar and volume
+    --buyers/--sellers/--both  customer pool sizes
+    --output-dir DIR         where the output files are written (default: seeds)
+
+--format parquet writes customers/items_v2/bids/fees.parquet instead of CSV
+(requires pyarrow): typed columns (int32/int64 ids and money amounts, date32
+auctiondate, timestamp bid_timestamp), written as Arrow record batches with
+--row-group-size rows per row group. With --stream each auction day is
+appended to the open Parquet writers.
+
+--append N adds the next N auction days to the existing CSV output in
+--output-dir instead of regenerating the season: ids continue from the highest
+unique_id/bid_id/fee_id on disk, the existing customers.csv is reused, and the
+state quotas continue from the items already generated (pass the same --volume
+as the original run). load_raw_data.py --append does the same against the
+database.
+
+--fee-summary also writes fee_summary.csv/.parquet: one row per item with its
+fees pivoted by type and totalled (the int_fee_summary model's columns), for
+`dbt run --vars '{fee_summary_source: true}'` to read instead of aggregating
+fees.csv. With --append it extends an existing fee_summary.csv.
+
+--profile reports rows/second per table, peak RSS and the time spent in the
+per-row helpers; --profile-output FILE also dumps cProfile stats (read them
+with `python -m pstats FILE`). scripts/bench_generator.py holds the matching
+pytest-benchmark suite.
 """
 
+import argparse
+import cProfile
+import contextlib
 import csv
+import io
+import os
 import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import defaultdict, deque
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for --engine numpy
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is only needed for --format parquet
+    pa = None
+
+try:
+    import resource
+except ImportError:  # not available on Windows; --profile then skips peak RSS
+    resource = None
 
 # Set random seed for reproducibility
 random.seed(42)
@@ -188,21 +262,83 @@ FEE_TYPES = {
     'Decal Removal': 100,      # 20% of items
 }
 
+# Output columns per file
+CUSTOMER_FIELDS = ['customer_id', 'first_name', 'last_name', 'email', 'state', 'customer_type',
+                   'business_segment', 'active']
+
+ITEM_FIELDS = ['unique_id', 'icn', 'auctiondate', 'year', 'make', 'model', 'category', 'subcategory',
+               'location_state', 'location_city', 'starting_bid', 'reserve_price', 'hammer',
+               'buyers_premium', 'contract_price', 'reserve_met', 'seller_id', 'buyer_id', 'num_bids',
+               'region_id', 'district_id', 'territory_id', 'business_segment']
+
+BID_FIELDS = ['bid_id', 'item_id', 'bidder_id', 'bid_amount', 'bid_timestamp', 'is_winning_bid']
+
+FEE_FIELDS = ['fee_id', 'item_id', 'fee_type', 'fee_amount']
+
+# --fee-summary: one row per item with its fees pivoted by type (FEE_TYPES order)
+FEE_SUMMARY_FIELDS = ['item_id', 'seller_service_fee', 'lot_fee', 'power_washing', 'decal_removal', 'total_fees']
+
+# Parquet column types (--format parquet); columns not listed are strings.
+# Matches the raw table types in scripts/load_raw_data.py.
+COLUMN_TYPES = {
+    'customer_id': 'int32', 'active': 'int32',
+    'unique_id': 'int32', 'auctiondate': 'date32', 'year': 'int32', 'starting_bid': 'int32',
+    'reserve_price': 'int32', 'hammer': 'int32', 'buyers_premium': 'int32', 'contract_price': 'int32',
+    'reserve_met': 'int32', 'seller_id': 'int32', 'buyer_id': 'int32', 'num_bids': 'int32',
+    'region_id': 'int32', 'district_id': 'int32', 'territory_id': 'int32',
+    'bid_id': 'int64', 'item_id': 'int32', 'bidder_id': 'int32', 'bid_amount': 'int32',
+    'bid_timestamp': 'timestamp', 'is_winning_bid': 'int32',
+    'fee_id': 'int64', 'fee_amount': 'int32',
+    'seller_service_fee': 'int32', 'lot_fee': 'int32', 'power_washing': 'int32', 'decal_removal': 'int32',
+    'total_fees': 'int32',
+}
+
+PARQUET_ROW_GROUP_SIZE = 128 * 1024
+
+# Run settings, changed by configure() (see --start-date, --volume, ... below).
+# STATE_DISTRIBUTION and the daily volumes are sized for the default season.
+DEFAULT_START_DATE = datetime(2025, 8, 1)
+DEFAULT_END_DATE = datetime(2025, 12, 31)
+START_DATE = DEFAULT_START_DATE
+END_DATE = DEFAULT_END_DATE
+VOLUME_MULTIPLIER = 1.0
+CUSTOMER_POOL = {'buyer': 2000, 'seller': 500, 'both': 150}
+OUTPUT_DIR = 'seeds'
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
-def generate_auction_dates():
-    """Generate all auction dates (Tue/Wed/Thu) from Aug-Dec 2025, excluding holidays."""
+def configure(start_date=DEFAULT_START_DATE, end_date=DEFAULT_END_DATE, volume=1.0,
+              buyers=2000, sellers=500, both=150, output_dir='seeds'):
+    """Set the run settings used by the generation functions."""
+    global START_DATE, END_DATE, VOLUME_MULTIPLIER, OUTPUT_DIR
+    if end_date < start_date:
+        raise ValueError(f"end date {end_date:%Y-%m-%d} is before start date {start_date:%Y-%m-%d}")
+    if volume <= 0:
+        raise ValueError(f"volume multiplier must be positive, got {volume}")
+    START_DATE = start_date
+    END_DATE = end_date
+    VOLUME_MULTIPLIER = volume
+    CUSTOMER_POOL.update(buyer=buyers, seller=sellers, both=both)
+    OUTPUT_DIR = output_dir
+
+def get_holidays(year):
+    """Auction holidays in a year: Thanksgiving (fourth Thursday of November) and Christmas."""
+    november_1 = datetime(year, 11, 1)
+    thanksgiving = november_1 + timedelta(days=(3 - november_1.weekday()) % 7 + 21)
+    return [thanksgiving, datetime(year, 12, 25)]
+
+def generate_auction_dates(start_date=None, end_date=None):
+    """Generate all auction dates (Tue/Wed/Thu) from START_DATE to END_DATE, excluding holidays."""
     dates = []
-    start_date = datetime(2025, 8, 1)
-    end_date = datetime(2025, 12, 31)
+    start_date = start_date or START_DATE
+    end_date = end_date or END_DATE
     
     # Holidays to skip
-    holidays = [
-        datetime(2025, 11, 27),  # Thanksgiving
-        datetime(2025, 12, 25),  # Christmas
-    ]
+    holidays = set()
+    for year in range(start_date.year, end_date.year + 1):
+        holidays.update(get_holidays(year))
     
     current = start_date
     while current <= end_date:
@@ -215,26 +351,50 @@ def generate_auction_dates():
     return dates
 
 def get_week_number(date):
-    """Get week number from start of August 2025."""
-    start = datetime(2025, 8, 1)
+    """Get week number within the date's season, counted from August 1 of its year (<= 0 before August)."""
+    start = datetime(date.year, 8, 1)
     delta = date - start
     return (delta.days // 7) + 1
 
-def items_per_day(date):
-    """Determine how many items to sell on this date."""
+def items_per_day_range(date, volume=None):
+    """Return the (min, max) number of items sold on this date, inclusive, scaled by the volume multiplier."""
+    volume = VOLUME_MULTIPLIER if volume is None else volume
     week = get_week_number(date)
     month = date.month
     
     # Week 15 slowdown (Thanksgiving week, late November)
     if week == 15:
-        return random.randint(180, 220)  # ~200 items/day (lower)
+        lo, hi = 180, 220  # ~200 items/day (lower)
     
     # December is the big month (833/day avg)
-    if month == 12:
-        return random.randint(750, 900)
+    elif month == 12:
+        lo, hi = 750, 900
     
     # Normal Aug-Nov (~313/day avg)
-    return random.randint(280, 350)
+    else:
+        lo, hi = 280, 350
+    
+    return max(1, round(lo * volume)), max(1, round(hi * volume))
+
+def expected_item_count(dates=None, volume=None):
+    """Mean number of items the auction dates produce (midpoint of each day's range)."""
+    dates = generate_auction_dates() if dates is None else dates
+    return sum(sum(items_per_day_range(date, volume)) / 2 for date in dates)
+
+def state_quotas(dates=None):
+    """
+    Per-state item quotas for the configured calendar (or the given dates) and volume.
+    
+    STATE_DISTRIBUTION is sized for the default season at 1x; quotas scale with
+    the expected item count so the geographic mix holds for any run size.
+    """
+    base = expected_item_count(generate_auction_dates(DEFAULT_START_DATE, DEFAULT_END_DATE), 1.0)
+    factor = expected_item_count(dates) / base
+    return {state: round(quota * factor) for state, quota in STATE_DISTRIBUTION.items()}
+
+def items_per_day(date):
+    """Determine how many items to sell on this date."""
+    return random.randint(*items_per_day_range(date))
 
 def get_category_distribution(date):
     """Get category distribution for this date (special handling for week 10 dip)."""
@@ -272,6 +432,25 @@ def pick_weighted_state():
     weights = list(STATE_DISTRIBUTION.values())
     return random.choices(states, weights=weights, k=1)[0]
 
+def order_item_bids(item_bids, starting_bid, hammer):
+    """
+    Turn one item's bid rows (winning bid last) into a valid bid sequence.
+    
+    Timestamps are drawn independently per bid, so they are sorted into bid
+    order. When the running increments overshoot the hammer, the losing bids
+    are scaled down between the starting bid and the hammer, so amounts rise
+    strictly and only the winning bid reaches it.
+    """
+    times = sorted(bid['bid_timestamp'] for bid in item_bids)
+    for bid, bid_time in zip(item_bids, times):
+        bid['bid_timestamp'] = bid_time
+    
+    top = item_bids[-2]['bid_amount'] if len(item_bids) > 1 else starting_bid
+    if top >= hammer:
+        span, overshoot = hammer - starting_bid, top - starting_bid + 1
+        for bid in item_bids[:-1]:
+            bid['bid_amount'] = starting_bid + (bid['bid_amount'] - starting_bid) * span // overshoot
+
 def get_region_district_territory(state):
     """
     Calculate region, district, and territory for a given state.
@@ -292,28 +471,186 @@ def get_region_district_territory(state):
     
     return region_id, district_id, territory_id
 
-def pick_seller_for_category(sellers, category):
+# ============================================================================
+# SELLER SELECTION
+# ============================================================================
+
+# Category → (preferred business segment, probability of picking from it)
+SELLER_SEGMENT_PREFERENCES = {
+    'Construction': ('Enterprise', 0.70),
+    'Passenger': ('Core', 0.60),
+}
+
+class AliasTable:
+    """
+    Walker/Vose alias table for O(1) weighted sampling.
+    
+    Building the table is O(n); every draw afterwards costs two uniform
+    numbers regardless of how many entries there are.
+    """
+    
+    def __init__(self, weights):
+        n = len(weights)
+        total = float(sum(weights))
+        scaled = [w * n / total for w in weights]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        
+        self._arrays = None
+    
+    def __len__(self):
+        return len(self.prob)
+    
+    def sample(self, rng=random):
+        """Draw one index using a `random`-style generator."""
+        i = int(rng.random() * len(self.prob))
+        return i if rng.random() < self.prob[i] else self.alias[i]
+    
+    def sample_array(self, rng, size):
+        """Draw `size` indices at once using a numpy Generator."""
+        if self._arrays is None:
+            self._arrays = np.array(self.prob), np.array(self.alias, dtype=np.int64)
+        prob, alias = self._arrays
+        idx = rng.integers(0, len(prob), size=size)
+        return np.where(rng.random(size) < prob[idx], idx, alias[idx])
+
+class SellerIndex:
+    """
+    Seller pool indexed by business segment, built once per run.
+    
+    Without weights every pick is a uniform random.choice over the pool (or one
+    segment of it). With weights, picks go through one alias table per segment,
+    so selection cost does not depend on how many sellers there are.
+    """
+    
+    def __init__(self, sellers, weights=None):
+        self.sellers = list(sellers)
+        # None holds the whole pool; sellers without a segment are only in that list
+        self.positions = {None: list(range(len(self.sellers)))}
+        for pos, seller in enumerate(self.sellers):
+            if seller.get('business_segment') is not None:
+                self.positions.setdefault(seller['business_segment'], []).append(pos)
+        
+        self.alias_tables = None
+        if weights is not None:
+            self.alias_tables = {
+                segment: AliasTable([weights[pos] for pos in positions])
+                for segment, positions in self.positions.items()
+            }
+    
+    def has_segment(self, segment):
+        return bool(self.positions.get(segment))
+    
+    def choice(self, segment=None):
+        """Pick one seller, optionally restricted to a business segment."""
+        positions = self.positions[segment]
+        if self.alias_tables is None:
+            if segment is None:
+                return random.choice(self.sellers)
+            return self.sellers[random.choice(positions)]
+        return self.sellers[positions[self.alias_tables[segment].sample()]]
+    
+    def sample_positions(self, rng, size, segment=None):
+        """Pick `size` seller positions at once using a numpy Generator."""
+        positions = np.asarray(self.positions[segment], dtype=np.int64)
+        if self.alias_tables is None:
+            return positions[rng.integers(0, len(positions), size=size)]
+        return positions[self.alias_tables[segment].sample_array(rng, size)]
+
+def seller_rank_weights(sellers, skew):
+    """Zipf-style weights (1/rank^skew) so a few sellers consign most items; None when skew is 0."""
+    if not skew:
+        return None
+    return [(rank + 1) ** -skew for rank in range(len(sellers))]
+
+def pick_seller_for_category(seller_index, category):
     """
     Pick a seller with preference based on category.
     
-    Construction → prefer Enterprise sellers
-    Passenger → prefer Core sellers
+    Construction → prefer Enterprise sellers (70%)
+    Passenger → prefer Core sellers (60%)
     Others → prefer Core/Expansion sellers
     """
-    if category == 'Construction':
-        # 70% chance to pick Enterprise if available, otherwise random
-        enterprise_sellers = [s for s in sellers if s.get('business_segment') == 'Enterprise']
-        if enterprise_sellers and random.random() < 0.70:
-            return random.choice(enterprise_sellers)
-    
-    elif category == 'Passenger':
-        # 60% chance to pick Core if available, otherwise random
-        core_sellers = [s for s in sellers if s.get('business_segment') == 'Core']
-        if core_sellers and random.random() < 0.60:
-            return random.choice(core_sellers)
+    if category in SELLER_SEGMENT_PREFERENCES:
+        segment, share = SELLER_SEGMENT_PREFERENCES[category]
+        if seller_index.has_segment(segment) and random.random() < share:
+            return seller_index.choice(segment)
     
     # Default: pick random seller
-    return random.choice(sellers)
+    return seller_index.choice()
+
+# ============================================================================
+# STATE QUOTA SAMPLING
+# ============================================================================
+
+class StateQuotaSampler:
+    """
+    Weighted state picker over the remaining per-state quotas.
+    
+    Remaining quotas live in a Fenwick (binary indexed) tree, so each draw and
+    each decrement is O(log n) in the number of states instead of rebuilding the
+    weight list for every item. Draws match random.choices over the same
+    remaining-quota weights, and once every quota is filled picks fall back to
+    pick_weighted_state.
+    """
+    
+    def __init__(self, quotas):
+        self.states = list(quotas.keys())
+        self.position = {state: i for i, state in enumerate(self.states)}
+        self.remaining = [max(0, q) for q in quotas.values()]
+        self.total = sum(self.remaining)
+        
+        # Build the tree in O(n): each node pushes its sum to its parent
+        n = len(self.remaining)
+        self.tree = [0] + self.remaining
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                self.tree[parent] += self.tree[i]
+        self.top_bit = 1 << (n.bit_length() - 1) if n else 0
+    
+    def _add(self, i, delta):
+        i += 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+    
+    def _find(self, x):
+        """Return the first position whose cumulative remaining quota exceeds x."""
+        pos, acc, step = 0, 0, self.top_bit
+        while step:
+            nxt = pos + step
+            if nxt < len(self.tree) and acc + self.tree[nxt] <= x:
+                pos, acc = nxt, acc + self.tree[nxt]
+            step >>= 1
+        return min(pos, len(self.remaining) - 1)
+    
+    def take(self, state):
+        """Count one item against a state's quota (no-op once the quota is filled)."""
+        i = self.position[state]
+        if self.remaining[i] > 0:
+            self.remaining[i] -= 1
+            self.total -= 1
+            self._add(i, -1)
+    
+    def pick(self):
+        """Pick a state weighted by remaining quota and count it against that quota."""
+        if self.total == 0:
+            # All quotas met, pick randomly
+            return pick_weighted_state()
+        
+        state = self.states[self._find(random.random() * self.total)]
+        self.take(state)
+        return state
 
 # ============================================================================
 # MAIN GENERATION FUNCTIONS
@@ -324,9 +661,9 @@ def generate_customers():
     customers = []
     customer_id = 1
     
-    # Generate 2000 buyers (no business_segment needed)
-    print("Generating 2000 buyers...")
-    for i in range(2000):
+    # Generate buyers (no business_segment needed)
+    print(f"Generating {CUSTOMER_POOL['buyer']} buyers...")
+    for i in range(CUSTOMER_POOL['buyer']):
         first, last = generate_customer_name()
         state = pick_weighted_state()
         customers.append({
@@ -341,9 +678,9 @@ def generate_customers():
         })
         customer_id += 1
     
-    # Generate 500 sellers with business_segment
-    print("Generating 500 sellers...")
-    for i in range(500):
+    # Generate sellers with business_segment
+    print(f"Generating {CUSTOMER_POOL['seller']} sellers...")
+    for i in range(CUSTOMER_POOL['seller']):
         first, last = generate_customer_name()
         state = pick_weighted_state()
         
@@ -366,9 +703,9 @@ def generate_customers():
         })
         customer_id += 1
     
-    # Generate 150 who are both (also need business_segment)
-    print("Generating 150 customers who are both buyers and sellers...")
-    for i in range(150):
+    # Generate customers who are both (also need business_segment)
+    print(f"Generating {CUSTOMER_POOL['both']} customers who are both buyers and sellers...")
+    for i in range(CUSTOMER_POOL['both']):
         first, last = generate_customer_name()
         state = pick_weighted_state()
         
@@ -393,27 +730,57 @@ def generate_customers():
     
     return customers
 
-def generate_items_bids_fees(customers):
-    """Generate items, bids, and fees together to maintain relationships."""
-    items = []
-    bids = []
-    fees = []
+class GenerationTotals:
+    """Running counters for the end-of-run summary, updated as auction days are generated."""
+    
+    def __init__(self):
+        self.days = 0
+        self.items = 0
+        self.bids = 0
+        self.fees = 0
+        self.items_by_state = defaultdict(int, dict.fromkeys(STATE_DISTRIBUTION, 0))
+    
+    def add_day(self, num_items, num_bids, num_fees):
+        self.days += 1
+        self.items += num_items
+        self.bids += num_bids
+        self.fees += num_fees
+    
+    def print_summary(self, target_by_state=None):
+        target_by_state = target_by_state or state_quotas()
+        print(f"\nGenerated {self.items} items across {self.days} auction days")
+        print(f"Generated {self.bids} total bids")
+        print(f"Generated {self.fees} fee records")
+        
+        # Print distribution summary
+        print("\n=== Items by State ===")
+        items_by_state = self.items_by_state
+        for state in sorted(items_by_state.keys(), key=lambda s: items_by_state[s], reverse=True):
+            print(f"  {state}: {items_by_state[state]:>5} items (target: {target_by_state[state]})")
+
+def iter_items_bids_fees(customers, totals, seller_skew=0.0, watermarks=None):
+    """
+    Generate items, bids, and fees together to maintain relationships.
     
-    item_id = 1
-    bid_id = 1
-    fee_id = 1
+    Yields one (items, bids, fees) tuple of row lists per auction day, so callers
+    can write each day out before the next one is generated. Counts are added to
+    totals (a GenerationTotals) as each day completes. With watermarks (see
+    configure_append) only the days after the existing data are generated.
+    """
+    item_id, bid_id, fee_id = watermarks.next_ids() if watermarks else (1, 1, 1)
     
     # Get seller and buyer pools
     sellers = [c for c in customers if c['customer_type'] in ['seller', 'both']]
     buyers = [c for c in customers if c['customer_type'] in ['buyer', 'both']]
+    seller_index = SellerIndex(sellers, seller_rank_weights(sellers, seller_skew))
     
     # Generate auction dates
     auction_dates = generate_auction_dates()
-    print(f"Generated {len(auction_dates)} auction days from Aug-Dec 2025")
+    print(f"Generated {len(auction_dates)} auction days from {START_DATE:%Y-%m-%d} to {END_DATE:%Y-%m-%d}")
     
     # Track items per state to match distribution
-    items_by_state = defaultdict(int)
-    target_by_state = STATE_DISTRIBUTION.copy()
+    items_by_state = totals.items_by_state
+    state_sampler = StateQuotaSampler(remaining_quotas(watermarks))
     
     # Generate items for each auction day
     for auction_date in auction_dates:
@@ -425,6 +792,10 @@ def generate_items_bids_fees(customers):
         
         print(f"  {date_str} (Week {week}): Generating {num_items} items...")
         
+        items = []
+        bids = []
+        fees = []
+        
         for _ in range(num_items):
             # Pick category based on distribution
             category = random.choices(
@@ -434,16 +805,7 @@ def generate_items_bids_fees(customers):
             )[0]
             
             # Pick state (weighted by remaining quota)
-            remaining_states = {s: max(0, target - items_by_state[s]) 
-                               for s, target in target_by_state.items()}
-            if sum(remaining_states.values()) == 0:
-                # All quotas met, pick randomly
-                state = pick_weighted_state()
-            else:
-                states = list(remaining_states.keys())
-                weights = list(remaining_states.values())
-                state = random.choices(states, weights=weights, k=1)[0]
-            
+            state = state_sampler.pick()
             items_by_state[state] += 1
             city = random.choice(STATE_CITIES[state])
             
@@ -465,7 +827,7 @@ def generate_items_bids_fees(customers):
             region_id, district_id, territory_id = get_region_district_territory(state)
             
             # Pick seller (with category preference) and buyer
-            seller = pick_seller_for_category(sellers, category)
+            seller = pick_seller_for_category(seller_index, category)
             buyer = random.choice(buyers)
             
             # Create item record
@@ -530,6 +892,8 @@ def generate_items_bids_fees(customers):
                 })
                 bid_id += 1
             
+            order_item_bids(bids[len(bids) - num_bids:], starting_bid, hammer)
+            
             # Generate fees for this item
             # Always have Seller Service Fee and Lot Fee
             fees.append({
@@ -569,21 +933,364 @@ def generate_items_bids_fees(customers):
                 fee_id += 1
             
             item_id += 1
+        
+        totals.add_day(len(items), len(bids), len(fees))
+        yield items, bids, fees
+
+def generate_items_bids_fees(customers, seller_skew=0.0):
+    """Generate all items, bids, and fees in memory as lists of row dicts."""
+    totals = GenerationTotals()
+    items, bids, fees = [], [], []
+    
+    for day_items, day_bids, day_fees in iter_items_bids_fees(customers, totals, seller_skew):
+        items.extend(day_items)
+        bids.extend(day_bids)
+        fees.extend(day_fees)
+    
+    totals.print_summary()
+    return items, bids, fees
+
+# ============================================================================
+# VECTORIZED (NUMPY) ENGINE
+# ============================================================================
+
+def _ragged_table(groups):
+    """Flatten a list of lists into (values, offsets, lengths) arrays for vectorized lookups."""
+    lengths = np.array([len(g) for g in groups], dtype=np.int64)
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    values = np.array([v for g in groups for v in g])
+    return values, offsets, lengths
+
+def _pick_ragged(rng, table, group_idx):
+    """Pick one value uniformly from each row's group of a ragged table."""
+    values, offsets, lengths = table
+    picks = (rng.random(len(group_idx)) * lengths[group_idx]).astype(np.int64)
+    return offsets[group_idx] + picks
+
+def build_lookup_tables(quotas=None):
+    """Convert the configuration dicts into arrays indexed by category/state position."""
+    categories = list(CATEGORY_DISTRIBUTION.keys())
+    states = list(STATE_DISTRIBUTION.keys())
+    
+    # Makes are picked per category, models per (category, make) pair
+    makes = [[make for make, _ in MAKES_MODELS[c]] for c in categories]
+    models = [models for c in categories for _, models in MAKES_MODELS[c]]
+    
+    return {
+        'categories': np.array(categories),
+        'min_price': np.array([PRICE_RANGES[c][0] for c in categories], dtype=np.int64),
+        'max_price': np.array([PRICE_RANGES[c][1] for c in categories], dtype=np.int64),
+        'subcategories': _ragged_table([SUBCATEGORIES[c] for c in categories]),
+        'makes': _ragged_table(makes),
+        'models': _ragged_table(models),
+        'states': np.array(states),
+        'state_weights': np.array(list(STATE_DISTRIBUTION.values()), dtype=np.float64),
+        'state_targets': np.array(list((quotas or state_quotas()).values()), dtype=np.int64),
+        'state_regions': np.array([STATE_TO_REGION[s] for s in states], dtype=np.int64),
+        'cities': _ragged_table([STATE_CITIES[s] for s in states]),
+        'fee_types': np.array(list(FEE_TYPES.keys())),
+        'fee_amounts': np.array(list(FEE_TYPES.values()), dtype=np.int64),
+    }
+
+def plan_auction_days(auction_dates, tables, seed):
+    """
+    Draw each day's item volume and its share of the state quotas, serially.
+    
+    Sampling item by item weighted by remaining quota is the same as shuffling the
+    multiset of quota slots, so a day's quota share is a multivariate
+    hypergeometric draw from the quotas still open. Planning is cheap (no items
+    are generated) and fixes everything that depends on earlier days, so the
+    days themselves can be generated independently.
+    """
+    rng = np.random.default_rng(seed)
+    remaining = tables['state_targets'].copy()
+    plan = []
+    
+    for auction_date in auction_dates:
+        lo, hi = items_per_day_range(auction_date)
+        num_items = int(rng.integers(lo, hi + 1))
+        quota_counts = rng.multivariate_hypergeometric(remaining, min(num_items, int(remaining.sum())))
+        remaining -= quota_counts
+        plan.append((auction_date, num_items, quota_counts))
+    
+    return plan
+
+def draw_day_states(rng, tables, quota_counts, num_items):
+    """
+    Draw the location state for every item sold on one day.
+    
+    quota_counts is the day's planned share of the state quotas; items past it
+    fall back to the pick_weighted_state weights.
+    """
+    state_idx = rng.permutation(np.repeat(np.arange(len(quota_counts)), quota_counts))
+    from_quota = len(state_idx)
+    if from_quota == num_items:
+        return state_idx
+    
+    weights = tables['state_weights']
+    overflow = rng.choice(len(weights), size=num_items - from_quota, p=weights / weights.sum())
+    return np.concatenate((state_idx, overflow))
+
+def generate_day_columns(rng, tables, pools, auction_date, state_idx, item_id, bid_id, fee_id):
+    """
+    Generate all items, bids and fees for one auction day as columnar arrays.
+    
+    state_idx holds the pre-drawn state index of each item sold that day.
+    Returns (items, bids, fees) as dicts mapping column name to array.
+    """
+    n = len(state_idx)
+    date_str = auction_date.strftime('%Y-%m-%d')
+    
+    # Category based on the day's distribution (week 10 dip handled by the lookup)
+    category_dist = get_category_distribution(auction_date)
+    category_probs = np.array([category_dist[c] for c in tables['categories']])
+    cat_idx = rng.choice(len(category_probs), size=n, p=category_probs / category_probs.sum())
+    
+    # Subcategory, make, model and city
+    subcategory = tables['subcategories'][0][_pick_ragged(rng, tables['subcategories'], cat_idx)]
+    make_idx = _pick_ragged(rng, tables['makes'], cat_idx)
+    make = tables['makes'][0][make_idx]
+    model = tables['models'][0][_pick_ragged(rng, tables['models'], make_idx)]
+    city = tables['cities'][0][_pick_ragged(rng, tables['cities'], state_idx)]
+    
+    # Prices (same ranges and rounding as the python engine)
+    min_price = tables['min_price'][cat_idx]
+    max_price = tables['max_price'][cat_idx]
+    starting_bid = rng.integers((min_price * 0.5).astype(np.int64), (min_price * 0.8).astype(np.int64) + 1)
+    reserve_price = rng.integers((min_price * 0.7).astype(np.int64), (min_price * 0.9).astype(np.int64) + 1)
+    hammer = rng.integers(min_price, max_price + 1)
+    reserve_met = (hammer >= reserve_price).astype(np.int64)
+    buyers_premium = (hammer * 0.10).astype(np.int64)  # 10% buyer premium
+    contract_price = hammer + buyers_premium
+    
+    # Region, district, territory from state
+    region_id = tables['state_regions'][state_idx]
+    district_id = (region_id - 1) * 4 + rng.integers(1, 5, size=n)
+    territory_id = (district_id - 1) * 8 + rng.integers(1, 9, size=n)
+    
+    # Seller with category preference (Construction → Enterprise 70%, Passenger → Core 60%)
+    seller_index = pools['seller_index']
+    seller_pos = seller_index.sample_positions(rng, n)
+    prefer = rng.random(n)
+    for category, (segment, share) in SELLER_SEGMENT_PREFERENCES.items():
+        if seller_index.has_segment(segment):
+            mask = (tables['categories'][cat_idx] == category) & (prefer < share)
+            seller_pos[mask] = seller_index.sample_positions(rng, int(mask.sum()), segment)
+    seller_id = pools['seller_ids'][seller_pos]
+    buyer_id = pools['buyer_ids'][rng.integers(0, len(pools['buyer_ids']), size=n)]
+    
+    # ICN: two letters followed by four digits, built as raw bytes
+    icn_bytes = np.empty((n, 6), dtype=np.uint8)
+    icn_bytes[:, :2] = rng.integers(ord('A'), ord('Z') + 1, size=(n, 2))
+    icn_bytes[:, 2:] = rng.integers(ord('0'), ord('9') + 1, size=(n, 4))
+    icn = icn_bytes.view('S6').ravel().astype(str)
+    
+    num_bids = rng.integers(1, 16, size=n)
+    unique_id = np.arange(item_id, item_id + n)
+    
+    items = {
+        'unique_id': unique_id,
+        'icn': icn,
+        'auctiondate': np.full(n, date_str),
+        'year': rng.integers(1990, 2025, size=n),
+        'make': make,
+        'model': model,
+        'category': tables['categories'][cat_idx],
+        'subcategory': subcategory,
+        'location_state': tables['states'][state_idx],
+        'location_city': city,
+        'starting_bid': starting_bid,
+        'reserve_price': reserve_price,
+        'hammer': hammer,
+        'buyers_premium': buyers_premium,
+        'contract_price': contract_price,
+        'reserve_met': reserve_met,
+        'seller_id': seller_id,
+        'buyer_id': buyer_id,
+        'num_bids': num_bids,
+        'region_id': region_id,
+        'district_id': district_id,
+        'territory_id': territory_id,
+        'business_segment': pools['seller_segments'][seller_pos],
+    }
+    
+    # Bids: running sum of increments per item, last bid is the hammer from the winner
+    total_bids = int(num_bids.sum())
+    bid_item = np.repeat(np.arange(n), num_bids)
+    last_bid = np.cumsum(num_bids) - 1
+    first_bid = last_bid - num_bids + 1
+    increments = rng.integers(100, 1001, size=total_bids)
+    running = np.cumsum(increments)
+    item_base = running[first_bid] - increments[first_bid]
+    bid_amount = starting_bid[bid_item] + running - item_base[bid_item]
+    
+    # Scale losing bids down where they overshoot the hammer (see order_item_bids)
+    top = np.where(num_bids > 1, bid_amount[last_bid - 1], starting_bid)
+    overshoot = (top >= hammer)[bid_item]
+    base = starting_bid[bid_item]
+    scaled = base + (bid_amount - base) * (hammer - starting_bid)[bid_item] // (top - starting_bid + 1)[bid_item]
+    bid_amount = np.where(overshoot, scaled, bid_amount)
+    bid_amount[last_bid] = hammer
     
-    print(f"\nGenerated {len(items)} items across {len(auction_dates)} auction days")
-    print(f"Generated {len(bids)} total bids")
-    print(f"Generated {len(fees)} fee records")
+    bidder_id = pools['buyer_ids'][rng.integers(0, len(pools['buyer_ids']), size=total_bids)]
+    bidder_id[last_bid] = buyer_id
+    is_winning_bid = np.zeros(total_bids, dtype=np.int64)
+    is_winning_bid[last_bid] = 1
     
-    # Print distribution summary
-    print("\n=== Items by State ===")
-    for state in sorted(items_by_state.keys(), key=lambda s: items_by_state[s], reverse=True):
-        print(f"  {state}: {items_by_state[state]:>5} items (target: {target_by_state[state]})")
+    # Bid timestamp (during auction day, 08:00-17:59), sorted into bid order within each item
+    minute_of_day = rng.integers(0, 10, size=total_bids) * 60 + rng.integers(0, 60, size=total_bids)
+    minute_of_day = minute_of_day[np.lexsort((minute_of_day, bid_item))]
+    timestamps = np.array([f"{date_str} {h:02d}:{m:02d}:00" for h in range(8, 18) for m in range(60)])
     
+    bids = {
+        'bid_id': np.arange(bid_id, bid_id + total_bids),
+        'item_id': unique_id[bid_item],
+        'bidder_id': bidder_id,
+        'bid_amount': bid_amount,
+        'bid_timestamp': timestamps[minute_of_day],
+        'is_winning_bid': is_winning_bid,
+    }
+    
+    # Fees: Seller Service Fee and Lot Fee always, Power Washing 60%, Decal Removal 20%
+    fee_flags = np.ones((n, len(tables['fee_types'])), dtype=bool)
+    fee_flags[:, 2] = rng.random(n) < 0.60
+    fee_flags[:, 3] = rng.random(n) < 0.20
+    fee_item, fee_type_idx = np.nonzero(fee_flags)
+    
+    fees = {
+        'fee_id': np.arange(fee_id, fee_id + len(fee_item)),
+        'item_id': unique_id[fee_item],
+        'fee_type': tables['fee_types'][fee_type_idx],
+        'fee_amount': tables['fee_amounts'][fee_type_idx],
+    }
+    
+    return items, bids, fees
+
+def build_customer_pools(customers, seller_skew=0.0):
+    """Build the seller index and buyer/seller arrays the numpy engine samples from."""
+    sellers = [c for c in customers if c['customer_type'] in ['seller', 'both']]
+    buyers = [c for c in customers if c['customer_type'] in ['buyer', 'both']]
+    
+    return {
+        'seller_index': SellerIndex(sellers, seller_rank_weights(sellers, seller_skew)),
+        'seller_ids': np.array([s['customer_id'] for s in sellers], dtype=np.int64),
+        'seller_segments': np.array([s.get('business_segment', 'Core') for s in sellers]),
+        'buyer_ids': np.array([b['customer_id'] for b in buyers], dtype=np.int64),
+    }
+
+def concat_columns(batches):
+    """Concatenate a list of column dicts into a single column dict."""
+    return {name: np.concatenate([batch[name] for batch in batches]) for name in batches[0]}
+
+# Lookup tables, customer pools and base seed for generate_planned_day; set once
+# per process (in every worker when generating with a process pool)
+_engine_context = None
+
+def _init_engine_context(tables, pools, seed):
+    global _engine_context
+    _engine_context = (tables, pools, seed)
+
+def day_rng(seed, auction_date):
+    """Independent random stream for one auction day, derived from the base seed."""
+    return np.random.default_rng([seed, auction_date.toordinal()])
+
+def generate_planned_day(day_plan):
+    """Generate one planned day with ids starting at 1; renumber_day makes them global."""
+    tables, pools, seed = _engine_context
+    auction_date, num_items, quota_counts = day_plan
+    rng = day_rng(seed, auction_date)
+    state_idx = draw_day_states(rng, tables, quota_counts, num_items)
+    items, bids, fees = generate_day_columns(rng, tables, pools, auction_date, state_idx, 1, 1, 1)
+    return state_idx, items, bids, fees
+
+def empty_day_columns(customers, seller_skew=0.0):
+    """Zero-length (items, bids, fees) column dicts with the dtypes of a generated day."""
+    tables = build_lookup_tables()
+    pools = build_customer_pools(customers, seller_skew)
+    rng = np.random.default_rng(0)
+    return generate_day_columns(rng, tables, pools, START_DATE, np.empty(0, dtype=np.int64), 1, 1, 1)
+
+def renumber_day(items, bids, fees, item_id, bid_id, fee_id):
+    """Shift a day's locally numbered ids so they continue from the previous day."""
+    items['unique_id'] += item_id - 1
+    bids['item_id'] += item_id - 1
+    fees['item_id'] += item_id - 1
+    bids['bid_id'] += bid_id - 1
+    fees['fee_id'] += fee_id - 1
+
+def _map_days(plan, workers, context):
+    """Generate planned days in order, in-process or across a pool of worker processes."""
+    if workers <= 1:
+        _init_engine_context(*context)
+        yield from map(generate_planned_day, plan)
+        return
+    
+    # Keep a bounded window of days in flight so streaming stays bounded in memory
+    with ProcessPoolExecutor(workers, initializer=_init_engine_context, initargs=context) as pool:
+        pending = deque()
+        for day_plan in plan:
+            pending.append(pool.submit(generate_planned_day, day_plan))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def iter_items_bids_fees_numpy(customers, totals, seed=42, seller_skew=0.0, workers=1, watermarks=None):
+    """
+    Vectorized equivalent of iter_items_bids_fees.
+    
+    Draws every field for a whole auction day in batches and yields one
+    (items, bids, fees) tuple of column dicts per auction day. Every day uses
+    its own seed derived from the base seed, so the output is the same for
+    any number of workers.
+    """
+    tables = build_lookup_tables(remaining_quotas(watermarks))
+    pools = build_customer_pools(customers, seller_skew)
+    
+    auction_dates = generate_auction_dates()
+    print(f"Generated {len(auction_dates)} auction days from {START_DATE:%Y-%m-%d} to {END_DATE:%Y-%m-%d}")
+    
+    plan = plan_auction_days(auction_dates, tables, seed)
+    item_id, bid_id, fee_id = watermarks.next_ids() if watermarks else (1, 1, 1)
+    
+    # Merge: days arrive in date order and get the next contiguous id ranges
+    days = _map_days(plan, workers, (tables, pools, seed))
+    for (auction_date, num_items, _), (state_idx, items, bids, fees) in zip(plan, days):
+        date_str = auction_date.strftime('%Y-%m-%d')
+        week = get_week_number(auction_date)
+        print(f"  {date_str} (Week {week}): Generated {num_items} items")
+        
+        renumber_day(items, bids, fees, item_id, bid_id, fee_id)
+        
+        state_counts = np.bincount(state_idx, minlength=len(tables['states']))
+        for state, count in zip(tables['states'], state_counts.tolist()):
+            totals.items_by_state[state] += count
+        totals.add_day(num_items, len(bids['bid_id']), len(fees['fee_id']))
+        
+        item_id += num_items
+        bid_id += len(bids['bid_id'])
+        fee_id += len(fees['fee_id'])
+        
+        yield items, bids, fees
+
+def generate_items_bids_fees_numpy(customers, seed=42, seller_skew=0.0, workers=1):
+    """Generate all items, bids, and fees in memory as column dicts."""
+    totals = GenerationTotals()
+    days = list(iter_items_bids_fees_numpy(customers, totals, seed, seller_skew, workers))
+    if not days:  # no auction days in the calendar: header-only output, like the python engine
+        days = [empty_day_columns(customers, seller_skew)]
+    items, bids, fees = (concat_columns([day[i] for day in days]) for i in range(3))
+    
+    totals.print_summary()
     return items, bids, fees
 
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
 def write_csv(filename, data, fieldnames):
     """Write data to CSV file."""
-    filepath = f'seeds/{filename}'
+    filepath = f'{OUTPUT_DIR}/{filename}'
     print(f"\nWriting {filepath}...")
     
     with open(filepath, 'w', newline='') as f:
@@ -593,40 +1300,600 @@ def write_csv(filename, data, fieldnames):
     
     print(f"  Wrote {len(data)} records")
 
+def write_csv_columns(filename, columns, fieldnames):
+    """Write a column dict (as produced by the numpy engine) to CSV file."""
+    filepath = f'{OUTPUT_DIR}/{filename}'
+    print(f"\nWriting {filepath}...")
+    
+    with open(filepath, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(zip(*(columns[name].tolist() for name in fieldnames)))
+    
+    print(f"  Wrote {len(columns[fieldnames[0]])} records")
+
+def arrow_schema(fieldnames):
+    """Arrow schema for an output table, typed from COLUMN_TYPES."""
+    types = {'int32': pa.int32(), 'int64': pa.int64(), 'date32': pa.date32(),
+             'timestamp': pa.timestamp('ms'), 'string': pa.string()}  # Parquet has no seconds unit
+    return pa.schema([(name, types[COLUMN_TYPES.get(name, 'string')]) for name in fieldnames])
+
+def record_batch(batch, schema):
+    """Convert a batch (list of row dicts or column dict) to an Arrow record batch."""
+    arrays = []
+    for field in schema:
+        values = batch[field.name] if isinstance(batch, dict) else [row[field.name] for row in batch]
+        if pa.types.is_date(field.type) or pa.types.is_timestamp(field.type):
+            # Both engines produce 'YYYY-MM-DD' / 'YYYY-MM-DD HH:MM:SS' strings
+            fmt = '%Y-%m-%d' if pa.types.is_date(field.type) else '%Y-%m-%d %H:%M:%S'
+            arrays.append(pc.strptime(pa.array(values, pa.string()), format=fmt, unit='s').cast(field.type))
+        else:
+            arrays.append(pa.array(values, field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+class ParquetTableWriter:
+    """
+    Appends record batches to one Parquet file in row groups of row_group_size rows.
+    
+    Batches are buffered and written out in full row groups, so small auction
+    days don't turn into many tiny row groups; only the last one is partial.
+    """
+    
+    def __init__(self, path, fieldnames, row_group_size=PARQUET_ROW_GROUP_SIZE):
+        self.schema = arrow_schema(fieldnames)
+        self.writer = pq.ParquetWriter(path, self.schema, compression='zstd')
+        self.row_group_size = row_group_size
+        self.pending = []
+        self.pending_rows = 0
+    
+    def write(self, batch):
+        rb = batch if isinstance(batch, pa.RecordBatch) else record_batch(batch, self.schema)
+        self.pending.append(rb)
+        self.pending_rows += rb.num_rows
+        if self.pending_rows >= self.row_group_size:
+            self._flush(full_groups_only=True)
+    
+    def _flush(self, full_groups_only=False):
+        table = pa.Table.from_batches(self.pending, schema=self.schema)
+        keep = table.num_rows % self.row_group_size if full_groups_only else 0
+        if table.num_rows > keep:
+            self.writer.write_table(table.slice(0, table.num_rows - keep), row_group_size=self.row_group_size)
+        self.pending = table.slice(table.num_rows - keep).to_batches()
+        self.pending_rows = keep
+    
+    def close(self):
+        self._flush()
+        self.writer.close()
+
+def write_parquet(filename, data, fieldnames, row_group_size=PARQUET_ROW_GROUP_SIZE):
+    """Write data (list of row dicts or column dict) to a Parquet file."""
+    filepath = f'{OUTPUT_DIR}/{filename}'
+    print(f"\nWriting {filepath}...")
+    
+    writer = ParquetTableWriter(filepath, fieldnames, row_group_size)
+    writer.write(data)
+    writer.close()
+    
+    print(f"  Wrote {batch_len(data)} records")
+
+def write_table(table, data, fieldnames, output_format='csv', row_group_size=PARQUET_ROW_GROUP_SIZE):
+    """Write a whole table as <table>.csv or <table>.parquet in OUTPUT_DIR."""
+    if output_format == 'parquet':
+        write_parquet(f'{table}.parquet', data, fieldnames, row_group_size)
+    elif isinstance(data, dict):
+        write_csv_columns(f'{table}.csv', data, fieldnames)
+    else:
+        write_csv(f'{table}.csv', data, fieldnames)
+
+def batch_rows(batch, fieldnames):
+    """Iterate a batch (list of row dicts or column dict) as lists of values in fieldnames order."""
+    if isinstance(batch, dict):
+        return zip(*(batch[name].tolist() for name in fieldnames))
+    return ([row[name] for name in fieldnames] for row in batch)
+
+def batch_len(batch):
+    """Number of rows in a batch (list of row dicts or column dict)."""
+    if isinstance(batch, dict):
+        return len(next(iter(batch.values())))
+    return len(batch)
+
+def summarize_fees(fees):
+    """
+    Pivot a batch of fees into FEE_SUMMARY_FIELDS rows, one per item, in the
+    same form as the batch (list of row dicts or column dict).
+    
+    An item's fees are generated with it, so each auction day's fees give
+    complete summary rows for that day's items.
+    """
+    columns = dict(zip(FEE_TYPES, FEE_SUMMARY_FIELDS[1:-1]))
+    if isinstance(fees, dict):
+        item_ids, item_idx = np.unique(fees['item_id'], return_inverse=True)
+        summary = {'item_id': item_ids}
+        for fee_type, column in columns.items():
+            amounts = np.where(fees['fee_type'] == fee_type, fees['fee_amount'], 0)
+            summary[column] = np.bincount(item_idx, amounts, minlength=len(item_ids)).astype(np.int64)
+        summary['total_fees'] = np.bincount(item_idx, fees['fee_amount'], minlength=len(item_ids)).astype(np.int64)
+        return summary
+    
+    summary = {}
+    for fee in fees:
+        row = summary.setdefault(fee['item_id'], {**dict.fromkeys(FEE_SUMMARY_FIELDS, 0), 'item_id': fee['item_id']})
+        row[columns[fee['fee_type']]] += fee['fee_amount']
+        row['total_fees'] += fee['fee_amount']
+    return list(summary.values())
+
+def encode_day(batches, fieldnames, output_format):
+    """
+    Serialize one day's batches for DayWriter: CSV text, or Arrow record batches
+    for Parquet, per table. Runs in DayWriter's worker processes.
+    """
+    if output_format == 'parquet':
+        return [record_batch(batch, arrow_schema(names)) for batch, names in zip(batches, fieldnames)]
+    encoded = []
+    for batch, names in zip(batches, fieldnames):
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(batch_rows(batch, names))
+        encoded.append(buffer.getvalue())
+    return encoded
+
+class DayWriter:
+    """
+    Writes items_v2, bids and fees one auction day at a time, as CSV or Parquet.
+    
+    Accepts either engine's day batches (lists of row dicts or column dicts),
+    so memory stays bounded by a single auction day (plus one pending Parquet
+    row group per table). With append=True rows are added to existing CSV files.
+    With fee_summary=True each day's fees are also written pivoted per item
+    (summarize_fees) to fee_summary.csv/.parquet.
+    
+    With workers > 1, days are serialized (encode_day) across a pool of worker
+    processes and the parent only writes the encoded days out in order, so
+    formatting rows does not serialize a multi-worker run. At most 2 * workers
+    days are in flight.
+    """
+    
+    TABLES = (('items_v2', ITEM_FIELDS), ('bids', BID_FIELDS), ('fees', FEE_FIELDS))
+    
+    def __init__(self, output_dir=None, output_format='csv', row_group_size=PARQUET_ROW_GROUP_SIZE,
+                 append=False, fee_summary=False, workers=1):
+        if append and output_format != 'csv':
+            raise ValueError("only CSV output can be appended to")
+        output_dir = output_dir or OUTPUT_DIR
+        tables = self.TABLES + ((('fee_summary', FEE_SUMMARY_FIELDS),) if fee_summary else ())
+        self.paths = [f'{output_dir}/{table}.{output_format}' for table, _ in tables]
+        self.fieldnames = [fieldnames for _, fieldnames in tables]
+        self.fee_summary = fee_summary
+        self.output_format = output_format
+        self.row_group_size = row_group_size
+        self.append = append
+        self.counts = [0] * len(tables)
+        self.files = []
+        self.writers = []
+        self.workers = workers
+        self.pool = None
+        self.pending = deque()
+    
+    def __enter__(self):
+        for path, fieldnames in zip(self.paths, self.fieldnames):
+            print(f"{'Appending to' if self.append else 'Streaming'} {path}...")
+            if self.output_format == 'parquet':
+                self.writers.append(ParquetTableWriter(path, fieldnames, self.row_group_size))
+                continue
+            f = open(path, 'a' if self.append else 'w', newline='')
+            writer = csv.writer(f)
+            if not self.append:
+                writer.writerow(fieldnames)
+            self.files.append(f)
+            self.writers.append(writer)
+        if self.workers > 1:
+            self.pool = ProcessPoolExecutor(self.workers)
+        return self
+    
+    def write_day(self, *batches):
+        """Write one day's (items, bids, fees) batches."""
+        if self.fee_summary:
+            batches += (summarize_fees(batches[2]),)
+        for i, batch in enumerate(batches):
+            self.counts[i] += batch_len(batch)
+        
+        if self.pool:
+            self.pending.append(self.pool.submit(encode_day, batches, self.fieldnames, self.output_format))
+            if len(self.pending) >= self.workers * 2:
+                self._write_encoded(self.pending.popleft().result())
+            return
+        for i, batch in enumerate(batches):
+            if self.output_format == 'parquet':
+                self.writers[i].write(batch)
+            else:
+                self.writers[i].writerows(batch_rows(batch, self.fieldnames[i]))
+    
+    def _write_encoded(self, encoded):
+        for i, data in enumerate(encoded):
+            if self.output_format == 'parquet':
+                self.writers[i].write(data)
+            else:
+                self.files[i].write(data)
+    
+    def __exit__(self, exc_type, *exc):
+        if self.pool:
+            if exc_type is None:
+                while self.pending:
+                    self._write_encoded(self.pending.popleft().result())
+            self.pool.shutdown(cancel_futures=True)
+        if self.output_format == 'parquet':
+            for writer in self.writers:
+                writer.close()
+        for f in self.files:
+            f.close()
+        for path, count in zip(self.paths, self.counts):
+            print(f"  Wrote {count} records to {path}")
+
+# ============================================================================
+# APPEND MODE
+# ============================================================================
+
+class Watermarks:
+    """High-water marks of an existing dataset, where an --append run picks up."""
+    
+    def __init__(self, first_date, last_date, item_id, bid_id, fee_id, items_by_state):
+        self.first_date = first_date
+        self.last_date = last_date
+        self.item_id = item_id
+        self.bid_id = bid_id
+        self.fee_id = fee_id
+        self.items_by_state = items_by_state
+    
+    def next_ids(self):
+        """First (unique_id, bid_id, fee_id) for the appended rows."""
+        return self.item_id + 1, self.bid_id + 1, self.fee_id + 1
+
+def next_auction_dates(after, count):
+    """The next `count` auction dates after a given date."""
+    dates = []
+    start = after + timedelta(days=1)
+    while len(dates) < count:
+        end = start + timedelta(days=7 * (count // 3 + 1))
+        dates.extend(generate_auction_dates(start, end))
+        start = end + timedelta(days=1)
+    return dates[:count]
+
+def configure_append(watermarks, days):
+    """Point the run at the next `days` auction days after an existing dataset."""
+    global START_DATE, END_DATE
+    dates = next_auction_dates(watermarks.last_date, days)
+    START_DATE, END_DATE = dates[0], dates[-1]
+    
+    # A fresh random stream per append, so consecutive appends don't repeat each other
+    random.seed(42 + watermarks.item_id)
+    return dates
+
+def remaining_quotas(watermarks=None):
+    """
+    Per-state quotas for this run. When appending, the quotas cover the season
+    from the dataset's first day through END_DATE, less the items already there.
+    """
+    if watermarks is None:
+        return state_quotas()
+    quotas = state_quotas(generate_auction_dates(watermarks.first_date, END_DATE))
+    return {state: max(0, quota - watermarks.items_by_state.get(state, 0)) for state, quota in quotas.items()}
+
+def last_csv_row(path):
+    """Last row of a CSV file as a dict (None if it only has a header), read from the end of the file."""
+    with open(path, newline='') as f:
+        header = next(csv.reader(f))
+    
+    with open(path, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        block = 4096
+        while True:
+            start = max(0, size - block)
+            f.seek(start)
+            lines = f.read().splitlines()
+            if start == 0 or len(lines) > 1:  # the last line is complete
+                break
+            block *= 2
+    
+    if start == 0 and len(lines) < 2:
+        return None
+    return dict(zip(header, next(csv.reader([lines[-1].decode()]))))
+
+def read_watermarks(output_dir=None):
+    """
+    Read the high-water marks of the CSV output in output_dir.
+    
+    items_v2.csv is scanned for the first date and the items per state; ids
+    only ever increase within a file, so the max bid_id and fee_id are read
+    from the last line of bids.csv and fees.csv.
+    """
+    output_dir = output_dir or OUTPUT_DIR
+    items_by_state = defaultdict(int)
+    first_date = last_date = None
+    item_id = 0
+    
+    with open(f'{output_dir}/items_v2.csv', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        id_col, date_col, state_col = (header.index(c) for c in ('unique_id', 'auctiondate', 'location_state'))
+        for row in reader:
+            items_by_state[row[state_col]] += 1
+            item_id = max(item_id, int(row[id_col]))
+            auction_date = row[date_col]
+            if first_date is None or auction_date < first_date:
+                first_date = auction_date
+            if last_date is None or auction_date > last_date:
+                last_date = auction_date
+    
+    if item_id == 0:
+        raise ValueError(f"{output_dir}/items_v2.csv has no items to append to")
+    
+    last_bid = last_csv_row(f'{output_dir}/bids.csv')
+    last_fee = last_csv_row(f'{output_dir}/fees.csv')
+    return Watermarks(
+        datetime.strptime(first_date, '%Y-%m-%d'),
+        datetime.strptime(last_date, '%Y-%m-%d'),
+        item_id,
+        int(last_bid['bid_id']) if last_bid else 0,
+        int(last_fee['fee_id']) if last_fee else 0,
+        dict(items_by_state),
+    )
+
+def read_customers(output_dir=None):
+    """Read customers.csv back into customer dicts, to reuse the pool when appending."""
+    output_dir = output_dir or OUTPUT_DIR
+    with open(f'{output_dir}/customers.csv', newline='') as f:
+        customers = list(csv.DictReader(f))
+    for customer in customers:
+        customer['customer_id'] = int(customer['customer_id'])
+        customer['business_segment'] = customer['business_segment'] or None
+        customer['active'] = int(customer['active'])
+    return customers
+
+# ============================================================================
+# PROFILING
+# ============================================================================
+
+class GeneratorProfiler:
+    """
+    Timing for --profile: wall time per stage and per helper, plus peak RSS.
+    
+    instrument() swaps the helpers below for timed wrappers. The numpy engine
+    generates whole days at once and never calls the per-row helpers, and
+    worker processes (--workers) are not instrumented.
+    """
+    
+    HELPERS = (
+        'pick_seller_for_category',
+        'StateQuotaSampler.pick',
+        'generate_icn',
+        'write_csv',
+        'write_csv_columns',
+        'write_parquet',
+        'DayWriter.write_day',
+    )
+    
+    def __init__(self):
+        self.stages = {}
+        self.calls = defaultdict(int)
+        self.seconds = defaultdict(float)
+    
+    def instrument(self):
+        for name in self.HELPERS:
+            owner_name, _, attr = name.rpartition('.')
+            owner = globals()[owner_name] if owner_name else None
+            func = getattr(owner, attr) if owner else globals()[attr]
+            timed = self._timed(name, func)
+            if owner:
+                setattr(owner, attr, timed)
+            else:
+                globals()[attr] = timed
+    
+    def _timed(self, name, func):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.seconds[name] += time.perf_counter() - start
+                self.calls[name] += 1
+        return timed
+    
+    @contextlib.contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        yield
+        self.stages[name] = time.perf_counter() - start
+    
+    def print_report(self, row_counts, workers=1):
+        """row_counts maps table -> (stage name, rows)."""
+        print("\n" + "=" * 80)
+        print("PROFILE")
+        print("=" * 80)
+        print(f"{'Table':<12} {'Stage':<18} {'Rows':>10} {'Seconds':>9} {'Rows/sec':>11}")
+        for table, (stage, rows) in row_counts.items():
+            seconds = self.stages[stage]
+            print(f"{table:<12} {stage:<18} {rows:>10,} {seconds:>9.2f} {rows / seconds:>11,.0f}")
+        
+        print(f"\n{'Helper':<28} {'Calls':>10} {'Seconds':>9} {'us/call':>9}")
+        for name in self.HELPERS:
+            if self.calls[name]:
+                per_call = self.seconds[name] / self.calls[name] * 1e6
+                print(f"{name:<28} {self.calls[name]:>10,} {self.seconds[name]:>9.2f} {per_call:>9.1f}")
+        
+        if resource is not None:
+            # ru_maxrss is KiB on Linux, bytes on macOS
+            unit = 1024 * 1024 if sys.platform == 'darwin' else 1024
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / unit
+            print(f"\nPeak RSS: {peak:,.0f} MiB")
+            if workers > 1:
+                children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / unit
+                print(f"Peak RSS of the largest worker: {children:,.0f} MiB")
+
 # ============================================================================
 # MAIN
 # ============================================================================
 
+def parse_date(value):
+    """argparse type for YYYY-MM-DD dates."""
+    try:
+        return datetime.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a YYYY-MM-DD date, got {value!r}")
+
+def add_scale_arguments(parser):
+    """Add the run-size options (shared with load_raw_data.py and benchmark_dbt_run.py)."""
+    group = parser.add_argument_group('scale')
+    group.add_argument('--start-date', type=parse_date, default=DEFAULT_START_DATE,
+                       help="First auction calendar day, YYYY-MM-DD (default: 2025-08-01)")
+    group.add_argument('--end-date', type=parse_date, default=DEFAULT_END_DATE,
+                       help="Last auction calendar day, YYYY-MM-DD (default: 2025-12-31)")
+    group.add_argument('--volume', type=float, default=1.0, metavar='X',
+                       help="Multiply items per auction day by X (default: 1)")
+    group.add_argument('--buyers', type=int, default=2000)
+    group.add_argument('--sellers', type=int, default=500)
+    group.add_argument('--both', type=int, default=150,
+                       help="Customers who both buy and sell")
+
+def configure_from_args(parser, args):
+    """configure() from add_scale_arguments options; errors are reported through the parser."""
+    try:
+        configure(args.start_date, args.end_date, args.volume, args.buyers, args.sellers,
+                  args.both, getattr(args, 'output_dir', OUTPUT_DIR))
+    except ValueError as e:
+        parser.error(str(e))
+    if args.sellers + args.both == 0 or args.buyers + args.both == 0:
+        parser.error("need at least one seller and one buyer (--sellers/--buyers/--both)")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate Purple Wave auction data for the Bronze layer.")
+    parser.add_argument('--engine', choices=['python', 'numpy'], default='python',
+                        help="Generation engine: row-at-a-time python (default) or columnar numpy")
+    parser.add_argument('--seller-skew', type=float, default=0.0,
+                        help="Weight sellers by 1/rank^SKEW (alias-method sampling); 0 picks uniformly (default)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Generate auction days across N processes (numpy engine only)")
+    parser.add_argument('--stream', action='store_true',
+                        help="Write each auction day to the CSV files as it is generated (bounded memory)")
+    parser.add_argument('--profile', action='store_true',
+                        help="Report rows/second, peak RSS and time spent in the per-row helpers")
+    parser.add_argument('--profile-output', metavar='FILE',
+                        help="Also dump cProfile stats to FILE (implies --profile)")
+    parser.add_argument('--output-dir', default='seeds',
+                        help="Directory for the output files (default: seeds)")
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv',
+                        help="Output file format (parquet requires pyarrow)")
+    parser.add_argument('--row-group-size', type=int, default=PARQUET_ROW_GROUP_SIZE,
+                        help=f"Rows per Parquet row group (default: {PARQUET_ROW_GROUP_SIZE})")
+    parser.add_argument('--append', type=int, metavar='DAYS',
+                        help="Add the next DAYS auction days to the existing CSV output instead of "
+                             "regenerating it (ids, customers and state quotas continue)")
+    parser.add_argument('--fee-summary', action='store_true',
+                        help="Also write fee_summary with each item's fees pivoted by type")
+    add_scale_arguments(parser)
+    args = parser.parse_args()
+    configure_from_args(parser, args)
+    
+    if args.engine == 'numpy' and np is None:
+        parser.error("--engine numpy requires numpy (pip install numpy)")
+    if args.format == 'parquet' and pa is None:
+        parser.error("--format parquet requires pyarrow (pip install pyarrow)")
+    if args.workers > 1 and args.engine != 'numpy':
+        parser.error("--workers requires --engine numpy (the python engine shares one random stream)")
+    if args.workers > 1 and (os.cpu_count() or 1) == 1:
+        print("Only one CPU available: running --workers serially")
+        args.workers = 1
+    if args.append is not None and args.append < 1:
+        parser.error("--append needs at least one auction day")
+    if args.append and args.format != 'csv':
+        parser.error("--append only works with CSV output (Parquet files can't be appended to)")
+    
+    return args
+
 def main():
+    args = parse_args()
+    
     print("=" * 80)
     print("Purple Wave Auction Data Generator")
     print("=" * 80)
     print("\nGenerating Bronze layer data...")
-    print(f"Target: 25,000 items across Aug-Dec 2025")
-    print(f"Customers: ~2,650 total (2,000 buyers + 500 sellers + 150 both)")
+    watermarks = None
+    if args.append:
+        try:
+            watermarks = read_watermarks()
+        except (OSError, ValueError) as e:
+            sys.exit(f"Cannot append: {e}")
+        if args.fee_summary and not os.path.exists(f'{OUTPUT_DIR}/fee_summary.csv'):
+            sys.exit(f"Cannot append: {OUTPUT_DIR}/fee_summary.csv does not exist (generate it with --fee-summary)")
+        dates = configure_append(watermarks, args.append)
+        print(f"Appending {len(dates)} auction days ({START_DATE:%Y-%m-%d} to {END_DATE:%Y-%m-%d}) after "
+              f"{watermarks.last_date:%Y-%m-%d}: ~{expected_item_count():,.0f} items from unique_id "
+              f"{watermarks.item_id + 1:,} (volume {VOLUME_MULTIPLIER:g}x)")
+    else:
+        print(f"Target: ~{expected_item_count():,.0f} items across "
+              f"{START_DATE:%Y-%m-%d} to {END_DATE:%Y-%m-%d} (volume {VOLUME_MULTIPLIER:g}x)")
+        print(f"Customers: ~{sum(CUSTOMER_POOL.values()):,} total ({CUSTOMER_POOL['buyer']:,} buyers + "
+              f"{CUSTOMER_POOL['seller']:,} sellers + {CUSTOMER_POOL['both']:,} both)")
+    print(f"Engine: {args.engine}")
+    print(f"Output: {OUTPUT_DIR}/")
     print()
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
     
-    # Generate customers first
-    customers = generate_customers()
+    profiler = GeneratorProfiler() if args.profile or args.profile_output else None
+    if profiler:
+        profiler.instrument()
+    stage = profiler.stage if profiler else lambda name: contextlib.nullcontext()
+    cprofile = cProfile.Profile() if args.profile_output else None
+    if cprofile:
+        cprofile.enable()
     
-    # Generate items, bids, and fees
-    items, bids, fees = generate_items_bids_fees(customers)
+    # Generate customers first (appending reuses the existing pool)
+    with stage('customers'):
+        customers = read_customers() if watermarks else generate_customers()
+    if not watermarks:
+        write_table('customers', customers, CUSTOMER_FIELDS, args.format, args.row_group_size)
     
-    # Write CSV files
-    write_csv('customers.csv', customers, 
-              ['customer_id', 'first_name', 'last_name', 'email', 'state', 'customer_type', 'business_segment', 'active'])
-    
-    write_csv('items_v2.csv', items,
-              ['unique_id', 'icn', 'auctiondate', 'year', 'make', 'model', 'category', 'subcategory',
-               'location_state', 'location_city', 'starting_bid', 'reserve_price', 'hammer', 
-               'buyers_premium', 'contract_price', 'reserve_met', 'seller_id', 'buyer_id', 'num_bids',
-               'region_id', 'district_id', 'territory_id', 'business_segment'])
-    
-    write_csv('bids.csv', bids,
-              ['bid_id', 'item_id', 'bidder_id', 'bid_amount', 'bid_timestamp', 'is_winning_bid'])
+    # Generate items, bids, and fees and write the output files
+    # (--workers always streams, so writing is spread across the workers too)
+    if args.stream or watermarks or args.workers > 1:
+        totals = GenerationTotals()
+        if args.engine == 'numpy':
+            days = iter_items_bids_fees_numpy(customers, totals, seller_skew=args.seller_skew,
+                                              workers=args.workers, watermarks=watermarks)
+        else:
+            days = iter_items_bids_fees(customers, totals, seller_skew=args.seller_skew,
+                                        watermarks=watermarks)
+        with stage('items/bids/fees'), DayWriter(output_format=args.format, row_group_size=args.row_group_size,
+                                                 append=bool(watermarks), fee_summary=args.fee_summary,
+                                                 workers=args.workers) as writer:
+            for items, bids, fees in days:
+                writer.write_day(items, bids, fees)
+        totals.print_summary(remaining_quotas(watermarks))
+        counts = (totals.items, totals.bids, totals.fees)
+    else:
+        with stage('items/bids/fees'):
+            if args.engine == 'numpy':
+                items, bids, fees = generate_items_bids_fees_numpy(customers, seller_skew=args.seller_skew,
+                                                                   workers=args.workers)
+            else:
+                items, bids, fees = generate_items_bids_fees(customers, seller_skew=args.seller_skew)
+        for (table, fieldnames), data in zip(DayWriter.TABLES, (items, bids, fees)):
+            write_table(table, data, fieldnames, args.format, args.row_group_size)
+        if args.fee_summary:
+            write_table('fee_summary', summarize_fees(fees), FEE_SUMMARY_FIELDS, args.format, args.row_group_size)
+        counts = (batch_len(items), batch_len(bids), batch_len(fees))
     
-    write_csv('fees.csv', fees,
-              ['fee_id', 'item_id', 'fee_type', 'fee_amount'])
+    if cprofile:
+        cprofile.disable()
+        cprofile.dump_stats(args.profile_output)
+    if profiler:
+        # With --stream, writing happens inside the items/bids/fees stage
+        profiler.print_report({
+            'customers': ('customers', len(customers)),
+            'items': ('items/bids/fees', counts[0]),
+            'bids': ('items/bids/fees', counts[1]),
+            'fees': ('items/bids/fees', counts[2]),
+        }, workers=args.workers)
+        if cprofile:
+            print(f"cProfile stats: {args.profile_output} (python -m pstats {args.profile_output})")
     
     print("\n" + "=" * 80)
     print("GENERATION COMPLETE!")
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Load generated auction data straight into the raw_data source tables.
+
+Streams rows from generate_auction_data.py into customers, items_v2, bids and
+fees (see models/sources.yml) with COPY FROM STDIN through psycopg2's
+copy_expert. Each auction day is encoded into one in-memory buffer per table,
+so there are no intermediate CSV files and no `dbt seed`.
+
+The whole load runs in one transaction: tables are truncated and refilled,
+and readers see either the old data or the new data, never a partial load.
+With --append N nothing is truncated: the next N auction days are added after
+the high-water marks already in the tables (last auctiondate, max
+unique_id/bid_id/fee_id), reusing the customers table and continuing the state
+quotas, so incremental dbt runs see realistic daily deltas.
+With --drop-indexes, secondary indexes on the four tables are dropped before
+the load and recreated from their original definitions afterwards.
+
+The connection comes from profiles.yml (--target, see scripts/db.py). Once
+the load commits, the integrity checks in CHECK_QUERIES run as a separate
+post-load step: the load itself is one transaction on one connection, and
+only the checks run concurrently, on up to four pooled connections (opened
+as needed; --skip-checks leaves it at the load's one).
+
+Usage:
+    python scripts/load_raw_data.py [--engine {python,numpy}] [--workers N] [--drop-indexes]
+    python scripts/load_raw_data.py --start-date 2023-01-01 --volume 10   # see generate_auction_data.py
+    python scripts/load_raw_data.py --append 3   # add the next 3 auction days (soak testing)
+    python scripts/load_raw_data.py --from-csv seeds   # COPY existing CSV files instead
+    python scripts/load_raw_data.py --from-parquet DIR  # ... or --format parquet output (pyarrow)
+"""
+
+import argparse
+import csv
+import io
+import os
+import sys
+import time
+from datetime import datetime
+
+import db
+import generate_auction_data as gad
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+# Raw table columns, in the order generate_auction_data.py writes them
+RAW_TABLES = {
+    'customers': [
+        ('customer_id', 'integer'), ('first_name', 'text'), ('last_name', 'text'), ('email', 'text'),
+        ('state', 'text'), ('customer_type', 'text'), ('business_segment', 'text'), ('active', 'integer'),
+    ],
+    'items_v2': [
+        ('unique_id', 'integer'), ('icn', 'text'), ('auctiondate', 'date'), ('year', 'integer'),
+        ('make', 'text'), ('model', 'text'), ('category', 'text'), ('subcategory', 'text'),
+        ('location_state', 'text'), ('location_city', 'text'), ('starting_bid', 'integer'),
+        ('reserve_price', 'integer'), ('hammer', 'integer'), ('buyers_premium', 'integer'),
+        ('contract_price', 'integer'), ('reserve_met', 'integer'), ('seller_id', 'integer'),
+        ('buyer_id', 'integer'), ('num_bids', 'integer'), ('region_id', 'integer'),
+        ('district_id', 'integer'), ('territory_id', 'integer'), ('business_segment', 'text'),
+    ],
+    'bids': [
+        ('bid_id', 'bigint'), ('item_id', 'integer'), ('bidder_id', 'integer'), ('bid_amount', 'integer'),
+        ('bid_timestamp', 'timestamp'), ('is_winning_bid', 'integer'),
+    ],
+    'fees': [
+        ('fee_id', 'bigint'), ('item_id', 'integer'), ('fee_type', 'text'), ('fee_amount', 'integer'),
+    ],
+}
+
+# Integrity checks run after the load, each on its own pooled connection;
+# every query returns the number of offending rows
+CHECK_QUERIES = {
+    'duplicate unique_id': 'SELECT count(*) - count(DISTINCT unique_id) FROM {schema}.items_v2',
+    'bids without an item': """
+        SELECT count(*) FROM {schema}.bids b
+        WHERE NOT EXISTS (SELECT 1 FROM {schema}.items_v2 i WHERE i.unique_id = b.item_id)
+    """,
+    'fees without an item': """
+        SELECT count(*) FROM {schema}.fees f
+        WHERE NOT EXISTS (SELECT 1 FROM {schema}.items_v2 i WHERE i.unique_id = f.item_id)
+    """,
+    'items without a winning bid': """
+        SELECT count(*) FROM {schema}.items_v2 i
+        WHERE NOT EXISTS (SELECT 1 FROM {schema}.bids b WHERE b.item_id = i.unique_id AND b.is_winning_bid = 1)
+    """,
+    'winning bid != hammer': """
+        SELECT count(*) FROM {schema}.bids b
+        JOIN {schema}.items_v2 i ON i.unique_id = b.item_id
+        WHERE b.is_winning_bid = 1 AND b.bid_amount <> i.hammer
+    """,
+    'items with an unknown seller or buyer': """
+        SELECT count(*) FROM {schema}.items_v2 i
+        WHERE NOT EXISTS (SELECT 1 FROM {schema}.customers c WHERE c.customer_id = i.seller_id)
+           OR NOT EXISTS (SELECT 1 FROM {schema}.customers c WHERE c.customer_id = i.buyer_id)
+    """,
+}
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+def column_definitions(table):
+    """Column list for CREATE TABLE, e.g. 'fee_id bigint, item_id integer, ...'."""
+    return ', '.join(f'{name} {sql_type}' for name, sql_type in RAW_TABLES[table])
+
+def create_tables(cur, schema):
+    """Create the raw tables if they do not exist yet (e.g. before the first dbt seed)."""
+    for table in RAW_TABLES:
+        cur.execute(f'CREATE TABLE IF NOT EXISTS {schema}.{table} ({column_definitions(table)})')
+
+def copy_rows(cur, schema, table, rows):
+    """COPY an iterable of value lists into a table through an in-memory CSV buffer."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(rows)
+    buffer.seek(0)
+
+    columns = ', '.join(name for name, _ in RAW_TABLES[table])
+    cur.copy_expert(f'COPY {schema}.{table} ({columns}) FROM STDIN WITH (FORMAT csv)', buffer)
+    return cur.rowcount
+
+def copy_file(cur, schema, table, path, target=None):
+    """
+    COPY an existing CSV file (with header) into a table, streaming it from disk.
+
+    target names a different table with the same columns (e.g. a staging table).
+    """
+    columns = ', '.join(name for name, _ in RAW_TABLES[table])
+    with open(path) as f:
+        cur.copy_expert(f'COPY {schema}.{target or table} ({columns}) FROM STDIN WITH (FORMAT csv, HEADER true)', f)
+    return cur.rowcount
+
+def copy_parquet(cur, schema, table, path, target=None):
+    """COPY a Parquet file into a table (or target, as in copy_file), one record batch at a time (requires pyarrow)."""
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    
+    columns = ', '.join(name for name, _ in RAW_TABLES[table])
+    options = pacsv.WriteOptions(include_header=False)
+    count = 0
+    for batch in pq.ParquetFile(path).iter_batches(columns=[name for name, _ in RAW_TABLES[table]]):
+        buffer = io.BytesIO()
+        pacsv.write_csv(batch, buffer, options)
+        buffer.seek(0)
+        cur.copy_expert(f'COPY {schema}.{target or table} ({columns}) FROM STDIN WITH (FORMAT csv)', buffer)
+        count += cur.rowcount
+    return count
+
+def drop_indexes(cur, schema):
+    """Drop secondary indexes on the raw tables and return their definitions."""
+    cur.execute("""
+        SELECT i.indexname, i.indexdef
+        FROM pg_indexes i
+        WHERE i.schemaname = %s
+          AND i.tablename = ANY(%s)
+          AND NOT EXISTS (
+              SELECT 1 FROM pg_constraint c
+              WHERE c.conindid = format('%%I.%%I', i.schemaname, i.indexname)::regclass
+          )
+    """, (schema, list(RAW_TABLES)))
+    indexes = cur.fetchall()
+
+    for name, _ in indexes:
+        cur.execute(f'DROP INDEX {schema}.{name}')
+    print(f"   ✓ Dropped {len(indexes)} indexes")
+    return [definition for _, definition in indexes]
+
+def run_checks(pool, schema):
+    """Run CHECK_QUERIES concurrently and print the result of each. Returns True if all pass."""
+    start = time.time()
+    results = db.run_parallel(pool, {name: sql.format(schema=schema) for name, sql in CHECK_QUERIES.items()})
+    for name, rows in results.items():
+        violations = rows[0][0]
+        print(f"   {'✗' if violations else '✓'} {name}" + (f": {violations:,}" if violations else ''))
+    print(f"   ({len(results)} checks on up to {pool.maxconn} connections in {time.time() - start:.1f}s)")
+    return not any(rows[0][0] for rows in results.values())
+
+def recreate_indexes(cur, definitions):
+    """Recreate indexes from the definitions returned by drop_indexes."""
+    start = time.time()
+    for definition in definitions:
+        cur.execute(definition)
+    print(f"   ✓ Recreated {len(definitions)} indexes in {time.time() - start:.1f}s")
+
+def read_watermarks(cur, schema):
+    """High-water marks of the data already loaded, for --append."""
+    cur.execute(f'SELECT min(auctiondate), max(auctiondate), max(unique_id) FROM {schema}.items_v2')
+    first_date, last_date, item_id = cur.fetchone()
+    if item_id is None:
+        raise ValueError(f"{schema}.items_v2 is empty, nothing to append to")
+
+    cur.execute(f'SELECT location_state, count(*) FROM {schema}.items_v2 GROUP BY location_state')
+    items_by_state = dict(cur.fetchall())
+    cur.execute(f'SELECT coalesce(max(bid_id), 0) FROM {schema}.bids')
+    bid_id = cur.fetchone()[0]
+    cur.execute(f'SELECT coalesce(max(fee_id), 0) FROM {schema}.fees')
+    fee_id = cur.fetchone()[0]
+
+    return gad.Watermarks(datetime.combine(first_date, datetime.min.time()),
+                          datetime.combine(last_date, datetime.min.time()),
+                          item_id, bid_id, fee_id, items_by_state)
+
+def read_customers(cur, schema):
+    """The customers table as customer dicts, to reuse the pool when appending."""
+    names = [name for name, _ in RAW_TABLES['customers']]
+    cur.execute(f"SELECT {', '.join(names)} FROM {schema}.customers ORDER BY customer_id")
+    return [dict(zip(names, row)) for row in cur.fetchall()]
+
+# ============================================================================
+# LOADING
+# ============================================================================
+
+def load_generated(cur, schema, args, watermarks=None):
+    """
+    Generate the dataset and COPY it day by day. Returns row counts per table.
+
+    With watermarks (see gad.configure_append) only the new days are generated,
+    for the customers already in the table.
+    """
+    counts = dict.fromkeys(RAW_TABLES, 0)
+
+    if watermarks:
+        customers = read_customers(cur, schema)
+    else:
+        customers = gad.generate_customers()
+        counts['customers'] = copy_rows(cur, schema, 'customers', gad.batch_rows(customers, gad.CUSTOMER_FIELDS))
+
+    totals = gad.GenerationTotals()
+    if args.engine == 'numpy':
+        days = gad.iter_items_bids_fees_numpy(customers, totals, seller_skew=args.seller_skew,
+                                              workers=args.workers, watermarks=watermarks)
+    else:
+        days = gad.iter_items_bids_fees(customers, totals, seller_skew=args.seller_skew,
+                                        watermarks=watermarks)
+
+    tables = (('items_v2', gad.ITEM_FIELDS), ('bids', gad.BID_FIELDS), ('fees', gad.FEE_FIELDS))
+    for batches in days:
+        for (table, fieldnames), batch in zip(tables, batches):
+            counts[table] += copy_rows(cur, schema, table, gad.batch_rows(batch, fieldnames))
+
+    totals.print_summary(gad.remaining_quotas(watermarks))
+    return counts
+
+def load_csv_dir(cur, schema, directory):
+    """COPY <table>.csv files from a directory. Returns row counts per table."""
+    return {table: copy_file(cur, schema, table, os.path.join(directory, f'{table}.csv'))
+            for table in RAW_TABLES}
+
+def load_parquet_dir(cur, schema, directory):
+    """COPY <table>.parquet files from a directory. Returns row counts per table."""
+    return {table: copy_parquet(cur, schema, table, os.path.join(directory, f'{table}.parquet'))
+            for table in RAW_TABLES}
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="COPY generated auction data into the raw_data tables.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--from-csv', metavar='DIR',
+                        help="Load <table>.csv files from DIR instead of generating rows")
+    source.add_argument('--from-parquet', metavar='DIR',
+                        help="Load <table>.parquet files from DIR (generate_auction_data.py --format parquet)")
+    source.add_argument('--append', type=int, metavar='DAYS',
+                        help="Keep the loaded data and add the next DAYS auction days after it")
+    parser.add_argument('--drop-indexes', action='store_true',
+                        help="Drop secondary indexes before the load and recreate them afterwards")
+    parser.add_argument('--engine', choices=['python', 'numpy'], default='python')
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--seller-skew', type=float, default=0.0)
+    parser.add_argument('--skip-checks', action='store_true',
+                        help="Don't run the post-load integrity checks (they run after the load commits, "
+                             f"concurrently on up to {db.DEFAULT_POOL_SIZE} connections)")
+    db.add_connection_arguments(parser)
+    gad.add_scale_arguments(parser)
+    args = parser.parse_args()
+    db.resolve_connection(parser, args)
+    gad.configure_from_args(parser, args)
+    if args.append is not None and args.append < 1:
+        parser.error("--append needs at least one auction day")
+    return args
+
+def main():
+    args = parse_args()
+
+    print("=" * 80)
+    print("Purple Wave Raw Data Loader (COPY)")
+    print("=" * 80)
+    print(f"Database: {args.user}@{args.host}:{args.port}/{args.dbname} (target {args.target})")
+
+    start = time.time()
+    with db.ConnectionPool(args) as pool:
+        # The load is one transaction on one connection; the checks see it once it commits
+        with pool.connection() as conn, conn.cursor() as cur:
+            print("\n1. Preparing tables...")
+            create_tables(cur, args.schema)
+            watermarks = None
+            if args.append:
+                watermarks = read_watermarks(cur, args.schema)
+                gad.configure_append(watermarks, args.append)
+                print(f"   ✓ Appending after {watermarks.last_date:%Y-%m-%d} (unique_id {watermarks.item_id:,}, "
+                      f"bid_id {watermarks.bid_id:,}, fee_id {watermarks.fee_id:,})")
+            else:
+                cur.execute(f"TRUNCATE {', '.join(f'{args.schema}.{t}' for t in RAW_TABLES)}")
+            index_definitions = drop_indexes(cur, args.schema) if args.drop_indexes else []
+
+            print("\n2. Loading rows...")
+            if args.from_csv:
+                counts = load_csv_dir(cur, args.schema, args.from_csv)
+            elif args.from_parquet:
+                counts = load_parquet_dir(cur, args.schema, args.from_parquet)
+            else:
+                counts = load_generated(cur, args.schema, args, watermarks)
+
+            print("\n3. Finalizing...")
+            recreate_indexes(cur, index_definitions)
+            for table in RAW_TABLES:
+                cur.execute(f'ANALYZE {args.schema}.{table}')
+        elapsed = time.time() - start
+
+        checks_passed = True
+        if not args.skip_checks:
+            print("\n4. Checking...")
+            checks_passed = run_checks(pool, args.schema)
+
+    print("\n" + "=" * 80)
+    print(f"✓ Loaded {sum(counts.values()):,} rows in {elapsed:.1f}s")
+    for table, count in counts.items():
+        print(f"   {table}: {count:,} rows")
+    if not checks_passed:
+        print("✗ Integrity checks failed (see above)")
+    print("=" * 80)
+    if not checks_passed:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
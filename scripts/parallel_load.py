@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Reload the raw_data tables from generated files, loading all tables at once.
+
+The tables are independent until their keys exist, so each one is loaded on
+its own pooled connection (scripts/db.py) and swapped in when all are ready:
+
+1. load: COPY every <table>.csv / <table>.parquet into an UNLOGGED staging
+   table <table>__load with no indexes or keys, all tables concurrently
+2. build: per table, concurrently: SET LOGGED, create the indexes and
+   primary/unique keys the live table has (plus --with-keys), ANALYZE
+3. foreign keys: added NOT VALID, then validated concurrently in one bulk
+   check each instead of row by row during the load
+4. swap: one transaction drops the live tables and renames the staging
+   tables, their indexes and keys into place. Views on the live tables
+   (the dbt staging views) are bound to the table, not its name, so they are
+   dropped and recreated from their definitions in the same transaction
+   (grants on them aren't carried over; dbt run re-applies its own).
+
+Readers see the old tables until the swap commits, and a failure before that
+leaves them untouched (the next run drops leftover staging tables).
+With --unlogged the tables stay unlogged: faster, but Postgres empties them
+after a crash, so only use it on disposable databases.
+
+Usage:
+    python scripts/generate_auction_data.py --engine numpy --workers 8 --output-dir target/raw_data
+    python scripts/parallel_load.py target/raw_data [--format parquet] [--with-keys]
+
+--with-keys declares primary keys on the id columns and foreign keys from
+items/bids/fees to customers and items. simulate_bid_stream.py --postgres
+inserts a lot after its bids, so don't stream into tables with those keys.
+"""
+
+import argparse
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import db
+import load_raw_data
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+STAGING_SUFFIX = '__load'
+
+# --with-keys: constraint name → definition; a {raw table} placeholder becomes
+# that table's staging name when the constraint is built
+KEYS = {
+    'customers': {
+        'customers_pkey': 'PRIMARY KEY (customer_id)',
+    },
+    'items_v2': {
+        'items_v2_pkey': 'PRIMARY KEY (unique_id)',
+        'items_v2_seller_id_fkey': 'FOREIGN KEY (seller_id) REFERENCES {customers} (customer_id)',
+        'items_v2_buyer_id_fkey': 'FOREIGN KEY (buyer_id) REFERENCES {customers} (customer_id)',
+    },
+    'bids': {
+        'bids_pkey': 'PRIMARY KEY (bid_id)',
+        'bids_item_id_fkey': 'FOREIGN KEY (item_id) REFERENCES {items_v2} (unique_id)',
+        'bids_bidder_id_fkey': 'FOREIGN KEY (bidder_id) REFERENCES {customers} (customer_id)',
+    },
+    'fees': {
+        'fees_pkey': 'PRIMARY KEY (fee_id)',
+        'fees_item_id_fkey': 'FOREIGN KEY (item_id) REFERENCES {items_v2} (unique_id)',
+    },
+}
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+def staged(name):
+    """Name of the staging copy of a table, index or constraint (within Postgres' 63 characters)."""
+    return name[:63 - len(STAGING_SUFFIX)] + STAGING_SUFFIX
+
+def run_concurrently(pool, func, items):
+    """Call func(item) for every item on the pool's threads. Returns the results in order."""
+    with ThreadPoolExecutor(pool.maxconn) as executor:
+        return list(executor.map(func, items))
+
+def read_live_definitions(cur, schema, with_keys):
+    """
+    Indexes and constraints of the live tables, to rebuild on the staging tables.
+
+    Returns {table: {'indexes': {name: definition}, 'keys': {name: definition},
+    'foreign_keys': {name: definition}}}, with definitions templated like KEYS.
+    """
+    definitions = {table: {'indexes': {}, 'keys': {}, 'foreign_keys': {}} for table in load_raw_data.RAW_TABLES}
+
+    # Plain indexes (constraint-backed ones come back with their constraint)
+    cur.execute("""
+        SELECT i.tablename, i.indexname, i.indexdef
+        FROM pg_indexes i
+        WHERE i.schemaname = %s
+          AND i.tablename = ANY(%s)
+          AND NOT EXISTS (
+              SELECT 1 FROM pg_constraint c
+              WHERE c.conindid = format('%%I.%%I', i.schemaname, i.indexname)::regclass
+          )
+    """, (schema, list(load_raw_data.RAW_TABLES)))
+    for table, name, definition in cur.fetchall():
+        # CREATE [UNIQUE] INDEX name ON [ONLY] schema.table USING ... → {name} / {table} placeholders
+        definition = re.sub(r'^(CREATE (?:UNIQUE )?INDEX )\S+( ON (?:ONLY )?)\S+',
+                            lambda m: f'{m.group(1)}{{name}}{m.group(2)}{{table}}', definition)
+        definitions[table]['indexes'][name] = definition
+
+    cur.execute("""
+        SELECT c.conrelid::regclass::text, c.conname, c.contype, pg_get_constraintdef(c.oid),
+               c.confrelid::regclass::text
+        FROM pg_constraint c
+        WHERE c.conrelid = ANY(%s::regclass[])
+    """, ([f'{schema}.{table}' for table in load_raw_data.RAW_TABLES],))
+    for relation, name, kind, definition, referenced in cur.fetchall():
+        table = relation.split('.')[-1]
+        if kind == 'f':
+            # Point the reference at the staging table, so it follows the swap
+            ref_table = referenced.split('.')[-1]
+            if ref_table in load_raw_data.RAW_TABLES:
+                definition = re.sub(r'REFERENCES \S+?\(', f'REFERENCES {{{ref_table}}}(', definition, count=1)
+            definitions[table]['foreign_keys'][name] = definition
+        else:
+            definitions[table]['keys'][name] = definition
+
+    if with_keys:
+        for table, keys in KEYS.items():
+            for name, definition in keys.items():
+                group = 'foreign_keys' if definition.startswith('FOREIGN KEY') else 'keys'
+                definitions[table][group].setdefault(name, definition)
+
+    return definitions
+
+def render(definition, values):
+    """Fill the {placeholder}s of a templated definition (unknown ones are left alone)."""
+    return re.sub(r'\{(\w+)\}', lambda m: values.get(m.group(1), m.group(0)), definition)
+
+def dependent_views(cur, schema):
+    """
+    Views and materialized views that depend on the live tables, directly or
+    through other views, as (name, kind, definition) in creation order.
+    """
+    cur.execute("""
+        WITH RECURSIVE deps AS (
+            SELECT r.ev_class AS view_oid, 1 AS depth
+            FROM pg_depend d
+            JOIN pg_rewrite r ON r.oid = d.objid
+            WHERE d.refobjid = ANY(%s::regclass[]) AND r.ev_class <> d.refobjid
+          UNION ALL
+            SELECT r.ev_class, deps.depth + 1
+            FROM deps
+            JOIN pg_depend d ON d.refobjid = deps.view_oid
+            JOIN pg_rewrite r ON r.oid = d.objid
+            WHERE r.ev_class <> d.refobjid
+        )
+        SELECT c.oid::regclass::text, c.relkind, pg_get_viewdef(c.oid)
+        FROM deps
+        JOIN pg_class c ON c.oid = deps.view_oid
+        GROUP BY c.oid, c.relkind
+        ORDER BY max(deps.depth), c.oid::regclass::text
+    """, ([f'{schema}.{table}' for table in load_raw_data.RAW_TABLES],))
+    return cur.fetchall()
+
+# ============================================================================
+# PHASES
+# ============================================================================
+
+def load_staging(pool, schema, directory, file_format):
+    """Phase 1: COPY each file into a fresh unlogged staging table, all tables at once."""
+    copy = load_raw_data.copy_parquet if file_format == 'parquet' else load_raw_data.copy_file
+
+    def load(table):
+        start = time.time()
+        with pool.connection() as conn, conn.cursor() as cur:
+            cur.execute(f'DROP TABLE IF EXISTS {schema}.{staged(table)} CASCADE')
+            cur.execute(f'CREATE UNLOGGED TABLE {schema}.{staged(table)} ({load_raw_data.column_definitions(table)})')
+            rows = copy(cur, schema, table, os.path.join(directory, f'{table}.{file_format}'), staged(table))
+        print(f"   ✓ {table}: {rows:,} rows in {time.time() - start:.1f}s")
+        return rows
+
+    return dict(zip(load_raw_data.RAW_TABLES, run_concurrently(pool, load, load_raw_data.RAW_TABLES)))
+
+def build_staging(pool, schema, definitions, unlogged):
+    """Phase 2: make each staging table durable, then build its indexes and keys and ANALYZE it."""
+    def build(table):
+        start = time.time()
+        target = f'{schema}.{staged(table)}'
+        indexes, keys = definitions[table]['indexes'], definitions[table]['keys']
+        with pool.connection() as conn, conn.cursor() as cur:
+            if not unlogged:
+                cur.execute(f'ALTER TABLE {target} SET LOGGED')
+            for name, definition in indexes.items():
+                cur.execute(render(definition, {'name': staged(name), 'table': target}))
+            for name, definition in keys.items():
+                cur.execute(f'ALTER TABLE {target} ADD CONSTRAINT {staged(name)} {definition}')
+            cur.execute(f'ANALYZE {target}')
+        print(f"   ✓ {table}: {len(indexes)} indexes, {len(keys)} keys in {time.time() - start:.1f}s")
+
+    run_concurrently(pool, build, load_raw_data.RAW_TABLES)
+
+def add_foreign_keys(pool, schema, definitions):
+    """
+    Phase 3: add every foreign key NOT VALID (a catalog change), then validate
+    them concurrently; VALIDATE takes locks that don't block each other.
+    """
+    tables = {table: f'{schema}.{staged(table)}' for table in load_raw_data.RAW_TABLES}
+    foreign_keys = [(table, name, render(definition, tables))
+                    for table in load_raw_data.RAW_TABLES
+                    for name, definition in definitions[table]['foreign_keys'].items()]
+    if not foreign_keys:
+        print("   - No foreign keys")
+        return
+
+    with pool.connection() as conn, conn.cursor() as cur:
+        for table, name, definition in foreign_keys:
+            cur.execute(f'ALTER TABLE {tables[table]} ADD CONSTRAINT {staged(name)} {definition} NOT VALID')
+
+    def validate(foreign_key):
+        table, name, _ = foreign_key
+        start = time.time()
+        with pool.connection() as conn, conn.cursor() as cur:
+            cur.execute(f'ALTER TABLE {tables[table]} VALIDATE CONSTRAINT {staged(name)}')
+        print(f"   ✓ {name} in {time.time() - start:.1f}s")
+
+    run_concurrently(pool, validate, foreign_keys)
+
+def swap(pool, schema, definitions):
+    """Phase 4: replace the live tables with the staging tables in one transaction."""
+    tables = list(load_raw_data.RAW_TABLES)
+    with pool.connection() as conn, conn.cursor() as cur:
+        # Lock first, so no view or query can start on the live tables mid-swap
+        cur.execute(f"LOCK TABLE {', '.join(f'{schema}.{t}' for t in tables)} IN ACCESS EXCLUSIVE MODE")
+        views = dependent_views(cur, schema)
+
+        for name, kind, _ in reversed(views):
+            cur.execute(f"DROP {'MATERIALIZED VIEW' if kind == 'm' else 'VIEW'} {name}")
+        cur.execute(f"DROP TABLE {', '.join(f'{schema}.{t}' for t in tables)}")
+
+        for table in tables:
+            cur.execute(f'ALTER TABLE {schema}.{staged(table)} RENAME TO {table}')
+            for name in definitions[table]['indexes']:
+                cur.execute(f'ALTER INDEX {schema}.{staged(name)} RENAME TO {name}')
+            for name in (*definitions[table]['keys'], *definitions[table]['foreign_keys']):
+                cur.execute(f'ALTER TABLE {schema}.{table} RENAME CONSTRAINT {staged(name)} TO {name}')
+
+        for name, kind, definition in views:
+            cur.execute(f"CREATE {'MATERIALIZED VIEW' if kind == 'm' else 'VIEW'} {name} AS {definition}")
+
+    return views
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Load the raw_data tables in parallel and swap them in atomically.")
+    parser.add_argument('directory', nargs='?', default='seeds',
+                        help="Directory holding customers/items_v2/bids/fees files (default: seeds)")
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv',
+                        help="File format of the generated data (parquet requires pyarrow)")
+    parser.add_argument('--jobs', type=int, default=len(load_raw_data.RAW_TABLES),
+                        help="Connections to load and build on (default: one per table)")
+    parser.add_argument('--with-keys', action='store_true',
+                        help="Also declare primary keys and foreign keys (see KEYS)")
+    parser.add_argument('--unlogged', action='store_true',
+                        help="Leave the tables UNLOGGED (faster, emptied after a crash)")
+    db.add_connection_arguments(parser)
+    args = parser.parse_args()
+    db.resolve_connection(parser, args)
+
+    if args.jobs < 1:
+        parser.error("--jobs needs at least one connection")
+    missing = [table for table in load_raw_data.RAW_TABLES
+               if not os.path.exists(os.path.join(args.directory, f'{table}.{args.format}'))]
+    if missing:
+        parser.error(f"{args.directory} has no {', '.join(f'{t}.{args.format}' for t in missing)}")
+
+    return args
+
+def main():
+    args = parse_args()
+
+    print("=" * 80)
+    print("Purple Wave Parallel Raw Data Loader")
+    print("=" * 80)
+    print(f"Database: {args.user}@{args.host}:{args.port}/{args.dbname} (target {args.target})")
+    print(f"Source: {args.directory}/*.{args.format}, {args.jobs} connections")
+
+    start = time.time()
+    phases = {}
+    with db.ConnectionPool(args, args.jobs) as pool:
+        with pool.connection() as conn, conn.cursor() as cur:
+            load_raw_data.create_tables(cur, args.schema)
+            definitions = read_live_definitions(cur, args.schema, args.with_keys)
+
+        for number, (phase, run) in enumerate([
+            ('Loading staging tables', lambda: load_staging(pool, args.schema, args.directory, args.format)),
+            ('Building indexes and keys', lambda: build_staging(pool, args.schema, definitions, args.unlogged)),
+            ('Validating foreign keys', lambda: add_foreign_keys(pool, args.schema, definitions)),
+            ('Swapping into place', lambda: swap(pool, args.schema, definitions)),
+        ], 1):
+            print(f"\n{number}. {phase}...")
+            phase_start = time.time()
+            phases[phase] = (run(), time.time() - phase_start)
+
+    counts = phases['Loading staging tables'][0]
+    views = phases['Swapping into place'][0]
+    print(f"   ✓ Swapped {len(counts)} tables; recreated {len(views)} dependent views"
+          + (f" ({', '.join(name for name, _, _ in views)})" if views else ''))
+
+    elapsed = time.time() - start
+    print("\n" + "=" * 80)
+    print(f"✓ Loaded {sum(counts.values()):,} rows in {elapsed:.1f}s")
+    for phase, (_, seconds) in phases.items():
+        print(f"   {phase}: {seconds:.1f}s")
+    for table, count in counts.items():
+        print(f"   {table}: {count:,} rows")
+    print("=" * 80)
+
+if __name__ == '__main__':
+    main()
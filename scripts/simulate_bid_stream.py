@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Replay new auction days as a time-compressed, change-data-capture style event stream.
+
+Generates the next auction days after an existing dataset (the same
+high-water marks, customer pool and state quotas as --append in
+generate_auction_data.py / load_raw_data.py) and emits every row as an insert
+event, in event-time order:
+- bids at their bid_timestamp; within an item, bids arrive in bid_id order
+  with rising amounts, the winning bid (the hammer) last
+- the lot (its items_v2 row) and its fees when it closes, right after the
+  winning bid
+
+Sinks:
+- JSON lines on stdout or --output FILE, one event per line:
+  {"op": "insert", "table": "bids", "ts": "2026-01-06 08:03:00", "row": {...}}
+  continuing after the CSV output in --data-dir (default: seeds)
+- --postgres: batched COPY into the raw tables, one commit per --batch-size
+  events (or per --flush-interval seconds when the stream is slower),
+  continuing after the rows already loaded (load_raw_data.py first); the
+  connection comes from profiles.yml (--target, see scripts/db.py)
+
+Pacing:
+- --speedup X plays X seconds of auction time per wall-clock second (an
+  auction day runs 08:00-18:00, so --speedup 600 plays a day in a minute);
+  days follow each other without waiting for the gap between them
+- --rate N caps the stream at N events per second
+With neither, events go out as fast as the sink takes them.
+
+Usage:
+    python scripts/simulate_bid_stream.py --days 3 --speedup 600 > bids.jsonl
+    python scripts/simulate_bid_stream.py --postgres --days 1 --rate 2000
+
+Progress and the end-of-run summary go to stderr, so stdout carries only events.
+"""
+
+import argparse
+import contextlib
+import json
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+
+import db
+import generate_auction_data as gad
+import load_raw_data
+
+# ============================================================================
+# EVENTS
+# ============================================================================
+
+def batch_dicts(batch, fieldnames):
+    """Rows of a batch (list of row dicts or column dict) as plain dicts."""
+    return [dict(zip(fieldnames, row)) for row in gad.batch_rows(batch, fieldnames)]
+
+def day_events(items, bids, fees):
+    """
+    One auction day as (event_time, table, row) tuples in event order.
+
+    Bids are ordered by (bid_timestamp, bid_id), so an item's bids keep their
+    order when they share a minute; a lot and its fees close with its winning bid.
+    """
+    lots = {item['unique_id']: item for item in batch_dicts(items, gad.ITEM_FIELDS)}
+    fees_by_item = defaultdict(list)
+    for fee in batch_dicts(fees, gad.FEE_FIELDS):
+        fees_by_item[fee['item_id']].append(fee)
+
+    events = []
+    for bid in batch_dicts(bids, gad.BID_FIELDS):
+        event_time = bid['bid_timestamp']
+        events.append((event_time, bid['bid_id'], 0, 'bids', bid))
+        if bid['is_winning_bid']:
+            events.append((event_time, bid['bid_id'], 1, 'items_v2', lots[bid['item_id']]))
+            events.extend((event_time, bid['bid_id'], 2, 'fees', fee) for fee in fees_by_item[bid['item_id']])
+
+    events.sort(key=lambda event: event[:3])
+    return [(event_time, table, row) for event_time, _, _, table, row in events]
+
+class Pacer:
+    """Holds events back so the stream runs at --speedup times auction time and/or --rate events/second."""
+
+    def __init__(self, speedup=None, rate=None):
+        self.speedup = speedup
+        self.rate = rate
+        self.start = time.monotonic()
+        self.events = 0
+        self.day_start = None
+        self.day_clock = None
+
+    def start_day(self, first_event_time):
+        """Restart the auction-time clock at a day's first event."""
+        self.day_start = datetime.strptime(first_event_time, '%Y-%m-%d %H:%M:%S')
+        self.day_clock = time.monotonic()
+
+    def delay(self, event_time):
+        """Seconds to wait before emitting the next event (0 when behind schedule)."""
+        due = time.monotonic()
+        if self.speedup:
+            elapsed = (datetime.strptime(event_time, '%Y-%m-%d %H:%M:%S') - self.day_start).total_seconds()
+            due = max(due, self.day_clock + elapsed / self.speedup)
+        if self.rate:
+            due = max(due, self.start + self.events / self.rate)
+        self.events += 1
+        return due - time.monotonic()
+
+# ============================================================================
+# SINKS
+# ============================================================================
+
+class JsonLinesSink:
+    """Writes events as JSON lines to a file object."""
+
+    def __init__(self, f):
+        self.f = f
+
+    def write(self, event_time, table, row):
+        self.f.write(json.dumps({'op': 'insert', 'table': table, 'ts': event_time, 'row': row}) + '\n')
+
+    def idle(self, seconds):
+        """Called before the stream sleeps for `seconds`."""
+        self.f.flush()
+
+    def close(self):
+        self.f.flush()
+
+class PostgresSink:
+    """
+    COPYs events into the raw tables in batches, committing each batch so readers see it.
+
+    A batch is committed when it holds batch_size events, or before the stream
+    idles past flush_interval seconds since the batch's first event, so slow
+    streams still become visible promptly.
+    """
+
+    def __init__(self, conn, schema, batch_size, flush_interval):
+        self.conn = conn
+        self.cur = conn.cursor()
+        self.schema = schema
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.pending = defaultdict(list)
+        self.pending_rows = 0
+        self.pending_since = None
+        self.batches = 0
+
+    def write(self, event_time, table, row):
+        self.pending[table].append([row[name] for name, _ in load_raw_data.RAW_TABLES[table]])
+        if not self.pending_rows:
+            self.pending_since = time.monotonic()
+        self.pending_rows += 1
+        if self.pending_rows >= self.batch_size:
+            self.flush()
+
+    def idle(self, seconds):
+        """Called before the stream sleeps for `seconds`."""
+        if self.pending_rows and time.monotonic() + seconds - self.pending_since >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        if not self.pending_rows:
+            return
+        # A lot closes after its bids, so they are committed no later than its items_v2 row
+        for table in ('bids', 'items_v2', 'fees'):
+            if self.pending[table]:
+                load_raw_data.copy_rows(self.cur, self.schema, table, self.pending[table])
+        self.conn.commit()
+        self.pending.clear()
+        self.pending_rows = 0
+        self.batches += 1
+
+    def close(self):
+        self.flush()
+        self.cur.close()
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Stream new auction days as time-ordered insert events.")
+    parser.add_argument('--days', type=int, default=1, help="Auction days to simulate (default: 1)")
+    parser.add_argument('--speedup', type=float, metavar='X',
+                        help="Play X seconds of auction time per second (default: no pacing)")
+    parser.add_argument('--rate', type=float, metavar='N', help="At most N events per second")
+    parser.add_argument('--output', metavar='FILE', help="JSON lines file (default: stdout)")
+    parser.add_argument('--data-dir', default=gad.OUTPUT_DIR,
+                        help="CSV output to continue from, for JSON lines (default: seeds)")
+    parser.add_argument('--postgres', action='store_true',
+                        help="Insert into the raw tables instead of writing JSON lines")
+    parser.add_argument('--batch-size', type=int, default=1000,
+                        help="Events per insert batch and commit (--postgres, default: 1000)")
+    parser.add_argument('--flush-interval', type=float, default=1.0, metavar='SECONDS',
+                        help="Commit a partial batch rather than hold events longer than this (--postgres, default: 1)")
+    parser.add_argument('--engine', choices=['python', 'numpy'], default='python')
+    parser.add_argument('--seller-skew', type=float, default=0.0)
+    parser.add_argument('--volume', type=float, default=1.0, metavar='X',
+                        help="Multiply items per auction day by X; use the dataset's own --volume (default: 1)")
+    db.add_connection_arguments(parser)
+    args = parser.parse_args()
+    if args.postgres:
+        db.resolve_connection(parser, args)
+
+    if args.days < 1:
+        parser.error("--days needs at least one auction day")
+    for name in ('speedup', 'rate', 'volume'):
+        value = getattr(args, name)
+        if value is not None and value <= 0:
+            parser.error(f"--{name} must be positive")
+    if args.postgres and args.output:
+        parser.error("--output is for JSON lines; --postgres writes to the database")
+    if args.engine == 'numpy' and gad.np is None:
+        parser.error("--engine numpy requires numpy (pip install numpy)")
+
+    return args
+
+def open_stream(args, stack, stdout):
+    """Read the watermarks and customers to continue from and open the sink. Returns (watermarks, customers, sink)."""
+    if args.postgres:
+        conn = db.connect(args)
+        stack.callback(conn.close)
+        with conn.cursor() as cur:
+            watermarks = load_raw_data.read_watermarks(cur, args.schema)
+            customers = load_raw_data.read_customers(cur, args.schema)
+        conn.commit()
+        return watermarks, customers, PostgresSink(conn, args.schema, args.batch_size, args.flush_interval)
+
+    watermarks = gad.read_watermarks(args.data_dir)
+    customers = gad.read_customers(args.data_dir)
+    f = stack.enter_context(open(args.output, 'w')) if args.output else stdout
+    return watermarks, customers, JsonLinesSink(f)
+
+def main():
+    args = parse_args()
+    stdout = sys.stdout
+
+    # Everything but the events goes to stderr, so stdout can carry the stream
+    with contextlib.redirect_stdout(sys.stderr), contextlib.ExitStack() as stack:
+        print("=" * 80)
+        print("Purple Wave Bid Stream Simulator")
+        print("=" * 80)
+
+        try:
+            watermarks, customers, sink = open_stream(args, stack, stdout)
+        except (OSError, ValueError) as e:
+            sys.exit(f"Cannot continue the dataset: {e}")
+
+        gad.configure(volume=args.volume)
+        dates = gad.configure_append(watermarks, args.days)
+        print(f"Streaming {len(dates)} auction days ({dates[0]:%Y-%m-%d} to {dates[-1]:%Y-%m-%d}) after "
+              f"{watermarks.last_date:%Y-%m-%d}, from unique_id {watermarks.item_id + 1:,}")
+        print(f"Sink: {'postgres ' + args.schema if args.postgres else args.output or 'stdout'}")
+        print()
+
+        totals = gad.GenerationTotals()
+        if args.engine == 'numpy':
+            days = gad.iter_items_bids_fees_numpy(customers, totals, seller_skew=args.seller_skew,
+                                                  watermarks=watermarks)
+        else:
+            days = gad.iter_items_bids_fees(customers, totals, seller_skew=args.seller_skew,
+                                            watermarks=watermarks)
+
+        pacer = Pacer(args.speedup, args.rate)
+        counts = defaultdict(int)
+        start = time.monotonic()
+        for items, bids, fees in days:
+            events = day_events(items, bids, fees)
+            pacer.start_day(events[0][0])
+            for event_time, table, row in events:
+                wait = pacer.delay(event_time)
+                if wait > 0.005:
+                    sink.idle(wait)
+                    time.sleep(wait)
+                sink.write(event_time, table, row)
+                counts[table] += 1
+        sink.close()
+        elapsed = time.monotonic() - start
+
+        total = sum(counts.values())
+        print("\n" + "=" * 80)
+        print(f"✓ Streamed {total:,} events in {elapsed:.1f}s ({total / max(elapsed, 1e-9):,.0f} events/s)")
+        for table in ('bids', 'items_v2', 'fees'):
+            print(f"   {table}: {counts[table]:,} inserts")
+        if args.postgres:
+            print(f"   {sink.batches:,} committed batches")
+        print("=" * 80)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Keep Superset's Redis chart cache in step with dbt.
+
+Commands:
+- apply-timeouts: set each mart dataset's cache timeout from
+  MART_CACHE_TIMEOUTS in superset_config.py
+- invalidate: drop cached chart data for every model that `dbt run` just
+  rebuilt successfully (read from target/run_results.json)
+
+Run invalidate right after every dbt run so dashboards stay fresh while still
+serving from cache between runs:
+
+    dbt run && python scripts/superset_cache.py invalidate
+
+Connection defaults match docker-compose.yml; override with SUPERSET_URL,
+SUPERSET_USERNAME and SUPERSET_PASSWORD.
+"""
+
+import argparse
+import ast
+import json
+import os
+
+import requests
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+def load_mart_timeouts(config_path):
+    """
+    Read MART_CACHE_TIMEOUTS from superset_config.py without importing it
+    (the config imports Superset-side packages such as cachelib).
+    """
+    with open(config_path) as f:
+        tree = ast.parse(f.read(), config_path)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, 'id', None) == 'MART_CACHE_TIMEOUTS'
+                                                for t in node.targets):
+            return eval(compile(ast.Expression(node.value), config_path, 'eval'), {})
+    raise KeyError(f"MART_CACHE_TIMEOUTS not found in {config_path}")
+
+# ============================================================================
+# SUPERSET API
+# ============================================================================
+
+def login(base_url, username, password):
+    """Return a requests session authenticated against the Superset REST API."""
+    session = requests.Session()
+    response = session.post(f'{base_url}/api/v1/security/login', json={
+        'username': username,
+        'password': password,
+        'provider': 'db',
+        'refresh': True,
+    })
+    response.raise_for_status()
+    session.headers['Authorization'] = f"Bearer {response.json()['access_token']}"
+
+    response = session.get(f'{base_url}/api/v1/security/csrf_token/')
+    response.raise_for_status()
+    session.headers['X-CSRFToken'] = response.json()['result']
+    session.headers['Referer'] = base_url
+    return session
+
+def find_datasets(session, base_url, table_names):
+    """Return {table_name: [dataset, ...]} for the Superset datasets backed by these tables."""
+    query = {
+        'filters': [{'col': 'table_name', 'opr': 'in', 'value': sorted(table_names)}],
+        'columns': ['id', 'table_name', 'schema', 'database.database_name'],
+        'page_size': 100,
+    }
+    response = session.get(f'{base_url}/api/v1/dataset/', params={'q': json.dumps(query)})
+    response.raise_for_status()
+
+    datasets = {}
+    for dataset in response.json()['result']:
+        datasets.setdefault(dataset['table_name'], []).append(dataset)
+    return datasets
+
+# ============================================================================
+# COMMANDS
+# ============================================================================
+
+def apply_timeouts(session, base_url, timeouts):
+    """Set cache_timeout on each mart's datasets."""
+    datasets = find_datasets(session, base_url, timeouts)
+    for table_name, timeout in timeouts.items():
+        for dataset in datasets.get(table_name, []):
+            response = session.put(f"{base_url}/api/v1/dataset/{dataset['id']}",
+                                   json={'cache_timeout': timeout})
+            response.raise_for_status()
+            print(f"   ✓ {table_name} (dataset {dataset['id']}): {timeout}s")
+        if table_name not in datasets:
+            print(f"   - {table_name}: no Superset dataset")
+
+def rebuilt_models(run_results_path):
+    """Names of the models a dbt run built successfully."""
+    with open(run_results_path) as f:
+        run_results = json.load(f)
+    return {
+        result['unique_id'].split('.')[-1]
+        for result in run_results['results']
+        if result['unique_id'].startswith('model.') and result['status'] == 'success'
+    }
+
+def invalidate(session, base_url, table_names):
+    """Invalidate cached chart data for the datasets backed by these tables."""
+    datasets = find_datasets(session, base_url, table_names)
+    datasources = [
+        {
+            'datasource_name': dataset['table_name'],
+            'schema': dataset['schema'],
+            'database_name': dataset['database']['database_name'],
+            'datasource_type': 'table',
+        }
+        for matches in datasets.values() for dataset in matches
+    ]
+    if not datasources:
+        print("   - No Superset datasets for the rebuilt models")
+        return
+
+    response = session.post(f'{base_url}/api/v1/cachekey/invalidate', json={'datasources': datasources})
+    response.raise_for_status()
+    for datasource in datasources:
+        print(f"   ✓ Invalidated {datasource['schema']}.{datasource['datasource_name']}")
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync Superset cache settings with dbt.")
+    parser.add_argument('command', choices=['apply-timeouts', 'invalidate'])
+    parser.add_argument('--url', default=os.environ.get('SUPERSET_URL', 'http://localhost:8088'))
+    parser.add_argument('--username', default=os.environ.get('SUPERSET_USERNAME', 'admin'))
+    parser.add_argument('--password', default=os.environ.get('SUPERSET_PASSWORD', 'admin'))
+    parser.add_argument('--run-results', default=os.path.join(REPO_ROOT, 'target', 'run_results.json'),
+                        help="dbt run_results.json to read rebuilt models from (invalidate)")
+    args = parser.parse_args()
+
+    session = login(args.url, args.username, args.password)
+
+    if args.command == 'apply-timeouts':
+        timeouts = load_mart_timeouts(os.path.join(REPO_ROOT, 'superset_config.py'))
+        print("Applying mart cache timeouts...")
+        apply_timeouts(session, args.url, timeouts)
+    else:
+        print("Invalidating Superset cache for rebuilt models...")
+        invalidate(session, args.url, rebuilt_models(args.run_results))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""
+Tests for generate_auction_data.py edge cases.
+
+    pytest scripts/test_generate_auction_data.py
+"""
+
+import csv
+import os
+import subprocess
+import sys
+
+import pytest
+
+import generate_auction_data as gad
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'generate_auction_data.py')
+
+@pytest.mark.parametrize('output_format', ['csv', 'parquet'])
+@pytest.mark.parametrize('engine', ['python', 'numpy'])
+def test_empty_calendar(tmp_path, engine, output_format):
+    """A date range without auction days (Fri-Sun) writes header-only item/bid/fee files."""
+    if engine == 'numpy' and gad.np is None:
+        pytest.skip("numpy engine requires numpy")
+    if output_format == 'parquet' and gad.pa is None:
+        pytest.skip("parquet output requires pyarrow")
+
+    subprocess.run([sys.executable, SCRIPT, '--engine', engine, '--format', output_format,
+                    '--start-date', '2025-12-26', '--end-date', '2025-12-28', '--output-dir', str(tmp_path)],
+                   check=True, capture_output=True)
+
+    for table, fieldnames in gad.DayWriter.TABLES:
+        path = tmp_path / f'{table}.{output_format}'
+        if output_format == 'parquet':
+            import pyarrow.parquet as pq
+            data = pq.read_table(path)
+            assert (data.num_rows, data.schema.names) == (0, fieldnames)
+        else:
+            with open(path, newline='') as f:
+                assert list(csv.reader(f)) == [fieldnames]
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Validate generated auction data against the invariants generate_auction_data.py
+promises.
+
+The CSV files are memory-mapped and split into fields with numpy in chunks of
+whole rows, and only the columns the checks need are parsed into typed arrays
+(no Python row objects), so multi-GB outputs validate in a few vectorized
+passes. Parquet output (--format parquet) is read through pyarrow's
+memory_map instead.
+
+Checks:
+- ids are contiguous from 1 (customers, items, bids, fees)
+- bids/fees reference existing items; sellers, buyers and bidders reference
+  customers of the right type, and each item carries its seller's segment
+- every item has exactly one winning bid, equal to the hammer and placed by
+  the buyer, and every losing bid is below the hammer; num_bids matches the
+  bid count and bids fall on the auction date
+- contract_price == hammer + buyers_premium, buyers_premium == 10% of hammer,
+  reserve_met == (hammer >= reserve_price)
+- every item has one Seller Service Fee and one Lot Fee, at most one of each
+  optional fee, and fee amounts match the fee schedule
+- every state reaches its item quota (state_quotas() for the scale options
+  the data was generated with)
+
+Usage:
+    python scripts/validate_auction_data.py [DIR] [--start-date ... --volume ...]
+
+Exits with status 1 if any check fails.
+"""
+
+import argparse
+import mmap
+import os
+import sys
+import time
+
+import numpy as np
+
+import generate_auction_data as gad
+
+# Columns each check reads, per table: name -> 'int', 'date' or 'str'
+COLUMNS = {
+    'customers': {'customer_id': 'int', 'customer_type': 'str', 'business_segment': 'str'},
+    'items_v2': {
+        'unique_id': 'int', 'auctiondate': 'date', 'location_state': 'str', 'reserve_price': 'int',
+        'hammer': 'int', 'buyers_premium': 'int', 'contract_price': 'int', 'reserve_met': 'int',
+        'seller_id': 'int', 'buyer_id': 'int', 'num_bids': 'int', 'business_segment': 'str',
+    },
+    'bids': {
+        'bid_id': 'int', 'item_id': 'int', 'bidder_id': 'int', 'bid_amount': 'int',
+        'bid_timestamp': 'date', 'is_winning_bid': 'int',
+    },
+    'fees': {'fee_id': 'int', 'item_id': 'int', 'fee_type': 'str', 'fee_amount': 'int'},
+}
+
+COMMA, NEWLINE, CR = ord(','), ord('\n'), ord('\r')
+
+# ============================================================================
+# CSV (MEMORY-MAPPED)
+# ============================================================================
+
+def parse_ints(buf, starts, ends):
+    """Parse unsigned decimal fields buf[starts:ends] into int64."""
+    width = int((ends - starts).max()) if len(starts) else 0
+    values = np.zeros(len(starts), dtype=np.int64)
+    if not width:
+        return values
+    # Gather every field right-aligned into one (rows, width) digit matrix, zero-padded on the left
+    offsets = ends[:, None] - width + np.arange(width)
+    digits = buf[np.maximum(offsets, 0)].astype(np.int64) - ord('0')
+    digits[offsets < starts[:, None]] = 0
+    if np.any((digits < 0) | (digits > 9)):
+        raise ValueError("non-numeric value in an integer column")
+    for k in range(width):
+        values = values * 10 + digits[:, k]
+    return values
+
+def parse_bytes(buf, starts, ends, width=None):
+    """Fields buf[starts:ends] as a fixed-width bytes array (truncated/zero-padded to width)."""
+    width = width or (int((ends - starts).max()) if len(starts) else 1)
+    offsets = starts[:, None] + np.arange(width)
+    chars = np.where(offsets < ends[:, None], buf[np.minimum(offsets, len(buf) - 1)], 0).astype(np.uint8)
+    return np.ascontiguousarray(chars).view(f'S{width}').ravel()
+
+def read_csv_columns(path, columns, chunk_bytes):
+    """
+    Parse the wanted columns of a generated CSV file into numpy arrays.
+
+    Fields never contain commas or quotes (the generator writes none), so
+    every ',' and newline ends a field. The file is processed in chunks of
+    whole rows straight out of the memory map.
+    """
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        header_end = mm.find(b'\n')
+        header = mm[:header_end].decode().rstrip('\r').split(',')
+        if mm.find(b'"') != -1:
+            raise ValueError(f"{path}: quoted CSV fields are not supported")
+        positions = {name: header.index(name) for name in columns}
+        ncols = len(header)
+
+        parts = {name: [] for name in columns}
+        start = header_end + 1
+        while start < len(mm):
+            end = len(mm) if start + chunk_bytes >= len(mm) else mm.rfind(b'\n', start, start + chunk_bytes) + 1
+            if end <= start:
+                raise ValueError(f"{path}: a row is longer than the chunk size")
+            buf = np.frombuffer(mm, dtype=np.uint8, count=end - start, offset=start)
+
+            seps = np.flatnonzero((buf == COMMA) | (buf == NEWLINE))
+            if buf[-1] != NEWLINE:  # no newline after the last row
+                seps = np.append(seps, len(buf))
+            if len(seps) % ncols:
+                raise ValueError(f"{path}: rows do not all have {ncols} fields")
+            ends = seps.reshape(-1, ncols)
+            starts = np.empty_like(ends)
+            starts.flat[0] = 0
+            starts.flat[1:] = ends.flat[:-1] + 1
+            # CRLF line endings (csv module default): drop the CR from the last field
+            last = ends[:, -1]
+            last -= (last > starts[:, -1]) & (buf[np.maximum(last - 1, 0)] == CR)
+
+            for name, kind in columns.items():
+                col_starts, col_ends = starts[:, positions[name]], ends[:, positions[name]]
+                if kind == 'int':
+                    parts[name].append(parse_ints(buf, col_starts, col_ends))
+                elif kind == 'date':  # YYYY-MM-DD prefix of a date or timestamp
+                    parts[name].append(parse_bytes(buf, col_starts, col_ends, 10).astype('datetime64[D]'))
+                else:
+                    parts[name].append(parse_bytes(buf, col_starts, col_ends))
+            del buf  # release the view before the mmap closes
+            start = end
+
+    return {name: concat(chunks) for name, chunks in parts.items()}
+
+def concat(chunks):
+    """Concatenate chunk arrays; bytes chunks may differ in width."""
+    if not chunks:
+        return np.array([])
+    if chunks[0].dtype.kind == 'S':
+        width = max(chunk.dtype.itemsize for chunk in chunks)
+        chunks = [chunk.astype(f'S{width}') for chunk in chunks]
+    return np.concatenate(chunks)
+
+# ============================================================================
+# PARQUET (PYARROW MEMORY MAP)
+# ============================================================================
+
+def read_parquet_columns(path, columns):
+    """Read the wanted columns of a generated Parquet file into numpy arrays."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(pa.memory_map(path), columns=list(columns))
+    arrays = {}
+    for name, kind in columns.items():
+        column = table.column(name)
+        if kind == 'int':
+            arrays[name] = column.to_numpy().astype(np.int64)
+        elif kind == 'date':
+            arrays[name] = column.cast(pa.date32()).to_numpy().astype('datetime64[D]')
+        else:
+            arrays[name] = column.fill_null('').to_numpy(zero_copy_only=False).astype('S')
+    return arrays
+
+# ============================================================================
+# CHECKS
+# ============================================================================
+
+class Validator:
+    """Collects check results and prints them as they run."""
+
+    def __init__(self):
+        self.failures = 0
+
+    def check(self, description, bad_count):
+        bad_count = int(bad_count)
+        if bad_count:
+            self.failures += 1
+            print(f"   ✗ {description}: {bad_count:,} violations")
+        else:
+            print(f"   ✓ {description}")
+
+def lookup(codes, names):
+    """Index of each bytes value in names (-1 if absent)."""
+    names = np.array([n.encode() for n in names])
+    order = np.argsort(names)
+    pos = np.clip(np.searchsorted(names[order], codes), 0, len(names) - 1)
+    idx = order[pos]
+    return np.where(names[idx] == codes, idx, -1)
+
+def validate(data):
+    """Run every check over the loaded tables. Returns the number of failed checks."""
+    v = Validator()
+    customers, items, bids, fees = data['customers'], data['items_v2'], data['bids'], data['fees']
+    n_customers, n_items = len(customers['customer_id']), len(items['unique_id'])
+
+    print("\nIds")
+    for table, column in (('customers', 'customer_id'), ('items_v2', 'unique_id'),
+                          ('bids', 'bid_id'), ('fees', 'fee_id')):
+        ids = data[table][column]
+        v.check(f"{table}.{column} runs 1..{len(ids):,}", np.count_nonzero(ids != np.arange(1, len(ids) + 1)))
+
+    print("\nReferences")
+    v.check("bids.item_id exists in items", np.count_nonzero((bids['item_id'] < 1) | (bids['item_id'] > n_items)))
+    v.check("fees.item_id exists in items", np.count_nonzero((fees['item_id'] < 1) | (fees['item_id'] > n_items)))
+    customer_type = customers['customer_type']
+    is_seller = np.isin(customer_type, [b'seller', b'both'])
+    is_buyer = np.isin(customer_type, [b'buyer', b'both'])
+    for table, column, allowed in (('items_v2', 'seller_id', is_seller), ('items_v2', 'buyer_id', is_buyer),
+                                   ('bids', 'bidder_id', is_buyer)):
+        ids = data[table][column]
+        known = (ids >= 1) & (ids <= n_customers)
+        v.check(f"{table}.{column} is a {'seller' if allowed is is_seller else 'buyer'}",
+                np.count_nonzero(~known) + np.count_nonzero(~allowed[ids[known] - 1]))
+    seller_segment = customers['business_segment'][np.clip(items['seller_id'], 1, n_customers) - 1]
+    v.check("items.business_segment matches the seller's",
+            np.count_nonzero(seller_segment.astype(items['business_segment'].dtype) != items['business_segment']))
+
+    print("\nBids")
+    bid_item = np.clip(bids['item_id'], 1, n_items) - 1
+    winning = bids['is_winning_bid'] == 1
+    v.check("every item has exactly one winning bid",
+            np.count_nonzero(np.bincount(bid_item[winning], minlength=n_items) != 1))
+    v.check("winning bid == hammer", np.count_nonzero(bids['bid_amount'][winning] != items['hammer'][bid_item[winning]]))
+    v.check("losing bids < hammer", np.count_nonzero(bids['bid_amount'][~winning] >= items['hammer'][bid_item[~winning]]))
+    v.check("winning bidder == buyer_id", np.count_nonzero(bids['bidder_id'][winning] != items['buyer_id'][bid_item[winning]]))
+    v.check("num_bids == bids per item", np.count_nonzero(np.bincount(bid_item, minlength=n_items) != items['num_bids']))
+    v.check("bids are placed on the auction date",
+            np.count_nonzero(bids['bid_timestamp'] != items['auctiondate'][bid_item]))
+
+    print("\nPrices")
+    hammer = items['hammer']
+    v.check("contract_price == hammer + buyers_premium",
+            np.count_nonzero(items['contract_price'] != hammer + items['buyers_premium']))
+    v.check("buyers_premium == 10% of hammer",
+            np.count_nonzero(items['buyers_premium'] != (hammer * 0.10).astype(np.int64)))
+    v.check("reserve_met == (hammer >= reserve_price)",
+            np.count_nonzero(items['reserve_met'] != (hammer >= items['reserve_price'])))
+
+    print("\nFees")
+    fee_names = list(gad.FEE_TYPES)
+    fee_type = lookup(fees['fee_type'], fee_names)
+    v.check("fee_type is in the fee schedule", np.count_nonzero(fee_type < 0))
+    known = fee_type >= 0
+    schedule = np.array(list(gad.FEE_TYPES.values()))
+    v.check("fee_amount matches the fee schedule",
+            np.count_nonzero(fees['fee_amount'][known] != schedule[fee_type[known]]))
+    fee_item = np.clip(fees['item_id'], 1, n_items) - 1
+    per_item = np.zeros((n_items, len(fee_names)), dtype=np.int64)
+    np.add.at(per_item, (fee_item[known], fee_type[known]), 1)
+    v.check("one Seller Service Fee and one Lot Fee per item", np.count_nonzero(per_item[:, :2] != 1))
+    v.check("at most one Power Washing / Decal Removal fee per item", np.count_nonzero(per_item[:, 2:] > 1))
+    for i, name in enumerate(fee_names):
+        count = int(per_item[:, i].sum())
+        print(f"     {name}: {count:,} fees, ${count * schedule[i]:,}")
+
+    print("\nState quotas")
+    quotas = gad.state_quotas()
+    states = lookup(items['location_state'], list(quotas))
+    v.check("location_state is a known state", np.count_nonzero(states < 0))
+    counts = np.bincount(states[states >= 0], minlength=len(quotas))
+    targets = np.array(list(quotas.values()))
+    attainment = counts / np.maximum(targets, 1)
+    print(f"     attainment: min {attainment.min():.1%} ({list(quotas)[attainment.argmin()]}), "
+          f"max {attainment.max():.1%} ({list(quotas)[attainment.argmax()]})")
+    if n_items >= targets.sum():
+        v.check("every state reaches its quota", np.count_nonzero(counts < targets))
+    else:
+        print(f"   - fewer items ({n_items:,}) than quota slots ({targets.sum():,}); quota check skipped")
+
+    return v.failures
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def load(directory, output_format, chunk_bytes):
+    """Read the checked columns of every table, reporting read throughput."""
+    # All four files up front, so a missing one fails before minutes of reading
+    for table in COLUMNS:
+        path = os.path.join(directory, f'{table}.{output_format}')
+        if not os.path.isfile(path):
+            sys.exit(f"{directory}: {table}.{output_format} not found")
+        if not os.path.getsize(path):
+            sys.exit(f"{directory}: {table}.{output_format} is empty")
+
+    data = {}
+    for table, columns in COLUMNS.items():
+        path = os.path.join(directory, f'{table}.{output_format}')
+        start = time.time()
+        if output_format == 'parquet':
+            data[table] = read_parquet_columns(path, columns)
+        else:
+            data[table] = read_csv_columns(path, columns, chunk_bytes)
+        elapsed = max(time.time() - start, 1e-9)
+        size_mb = os.path.getsize(path) / 1e6
+        rows = len(next(iter(data[table].values())))
+        print(f"   ✓ {path}: {rows:,} rows, {size_mb:,.1f} MB in {elapsed:.2f}s ({size_mb / elapsed:,.0f} MB/s)")
+    return data
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Check generated auction data against the generator's invariants.")
+    parser.add_argument('directory', nargs='?', default='seeds',
+                        help="Directory holding customers/items_v2/bids/fees (default: seeds)")
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv')
+    parser.add_argument('--chunk-mb', type=int, default=64,
+                        help="CSV bytes parsed per vectorized pass (default: 64)")
+    gad.add_scale_arguments(parser)
+    args = parser.parse_args()
+    gad.configure_from_args(parser, args)
+    return args
+
+def main():
+    args = parse_args()
+
+    print("=" * 80)
+    print("Purple Wave Auction Data Validation")
+    print("=" * 80)
+
+    print("\nReading columns...")
+    data = load(args.directory, args.format, args.chunk_mb * 1024 * 1024)
+    failures = validate(data)
+
+    print("\n" + "=" * 80)
+    print(f"✗ {failures} checks failed" if failures else "✓ All checks passed")
+    print("=" * 80)
+    raise SystemExit(1 if failures else 0)
+
+if __name__ == '__main__':
+    main()